@@ -4,21 +4,112 @@ A Flask web application with web scraping for job search integration.
 Enhanced with user authentication, expanded assessments, and dream job features.
 """
 
-import json
+import hashlib
 import os
 import re
+import secrets
+import sqlite3
+import sys
+import tempfile
+import threading
 import time
-import uuid
+from bisect import bisect_left
+from collections import OrderedDict, deque, namedtuple
 from datetime import datetime, timedelta
-from functools import wraps
-
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from functools import lru_cache, wraps
+from itertools import islice
+from types import MappingProxyType
+
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, g
+from flask.json.provider import DefaultJSONProvider
+from jinja2.utils import htmlsafe_json_dumps
+from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.security import generate_password_hash, check_password_hash
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to Flask's stdlib json provider
+    orjson = None
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # optional: fall back to werkzeug's PBKDF2 hashes
+    PasswordHasher = None
+
+
+def _persistent_secret_key(path=os.path.join(os.path.expanduser("~"), ".careerhub", "secret.bin")):
+    """Read the session signing key from disk, creating it on first boot so restarts and workers share it."""
+    try:
+        with open(path, "rb") as f:
+            key = f.read()
+        if key:
+            return key
+    except OSError:
+        pass
+    key = os.urandom(24)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write the key to a private temp file, then hard-link it into place: the link fails if another worker
+        # published first, and no reader can ever open a half-written key file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(key)
+            os.link(tmp_path, path)
+        finally:
+            os.unlink(tmp_path)
+    except FileExistsError:  # another worker created it first
+        with open(path, "rb") as f:
+            return f.read() or key
+    except OSError:  # read-only home: fall back to a per-process key
+        pass
+    return key
+
+
 app = Flask(__name__)
-app.secret_key = os.urandom(24)
+# Throwaway key until the app is served, so importing the module (tests, scripts) writes nothing to disk
+app.secret_key = os.environb.get(b"CAREERHUB_SECRET") or os.urandom(24)
 app.permanent_session_lifetime = timedelta(days=7)
 
+# Behind a reverse proxy, set CAREERHUB_TRUSTED_PROXIES to the number of proxies in front of the app so remote_addr
+# (which the login throttle keys on) is the client's address from X-Forwarded-For rather than the proxy's; leave it
+# unset when clients connect directly, since they could then forge the header
+if int(os.environ.get("CAREERHUB_TRUSTED_PROXIES", "0")):
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=int(os.environ["CAREERHUB_TRUSTED_PROXIES"]))
+
+
+def load_persistent_secret_key():
+    """Sign sessions with the on-disk key shared by restarts and workers, unless CAREERHUB_SECRET is set."""
+    if not os.environb.get(b"CAREERHUB_SECRET"):
+        app.secret_key = _persistent_secret_key()
+
+
+class CareerHubJSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider, extended to serialize the read-only mappings used for static data."""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, MappingProxyType):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
+
+class ORJSONProvider(CareerHubJSONProvider):
+    """JSON provider backed by orjson; keeps sorted keys and the default() hook of the stdlib provider."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app.json = ORJSONProvider(app) if orjson is not None else CareerHubJSONProvider(app)
+
 # ============================================================
 # IN-MEMORY DATA STORES
 # ============================================================
@@ -26,14 +117,28 @@ app.permanent_session_lifetime = timedelta(days=7)
 # User database: {email: {user_id, password_hash, profile, verified, ...}}
 users_db = {}
 
-# User likes tracking: {user_id: {post_id: timestamp, ...}}
+# User likes tracking: {user_id: {post_id: epoch_seconds, ...}} (only today's likes are kept)
 user_likes = {}
 
-# Company votes tracking: {company_id: {user_id: timestamp, ...}}
+# Company votes tracking: {company_id: {user_id: epoch_seconds, ...}}
 company_votes = {}
 
-# Dream job post votes: {post_id: {user_id: timestamp, ...}}
-dream_job_votes = {}
+# Recent failed logins per client address: {remote_addr: deque of epoch_seconds}, newest LOGIN_MAX_FAILURES only.
+# Addresses are ordered by their latest failure (oldest first), so record_login_failure drops the ones whose
+# failures have all left LOGIN_FAILURE_WINDOW and keeps at most LOGIN_FAILURE_ADDRS of them
+login_failures = OrderedDict()
+_login_failures_lock = threading.Lock()
+LOGIN_MAX_FAILURES = 10
+LOGIN_FAILURE_WINDOW = 60
+LOGIN_FAILURE_ADDRS = 10000
+
+# Write counters for cached read views: {store_name: version}; bump after mutating the store
+_data_versions = {"achievements": 0, "companies": 0, "offers": 0}
+
+# Copy-on-write stores: dream_companies, offer_showcase, their lookup indices and the user_achievements records.
+# Readers use whatever tuple or row they fetched without locking; writers never change a published tuple or row in
+# place, they build a replacement and rebind it while holding this lock
+_store_write_lock = threading.Lock()
 
 # User achievements/badges: {user_id: {badges: [], points: 0, offers_shared: 0, votes_cast: 0}}
 user_achievements = {
@@ -133,6 +238,26 @@ offer_showcase = [
     }
 ]
 
+
+# Small-domain string fields shared by many offer/company rows; interned so repeats share one object
+_INTERNED_FIELDS = ("company_id", "company", "location", "university", "position", "industry", "hiring_status")
+
+
+def _intern_fields(row):
+    """Intern the _INTERNED_FIELDS string values of an offer or company row in place."""
+    for field in _INTERNED_FIELDS:
+        value = row.get(field)
+        if isinstance(value, str):
+            row[field] = sys.intern(value)
+
+
+# Lookup index over offer_showcase: {offer_id: offer}
+OFFER_BY_ID = {}
+for _offer in offer_showcase:
+    _intern_fields(_offer)
+    OFFER_BY_ID[_offer["id"]] = _offer
+offer_showcase = tuple(offer_showcase)
+
 # Achievement badges configuration
 ACHIEVEMENT_BADGES = {
     "first_vote": {"name": "First Vote", "icon": "star", "desc": "Cast your first vote", "points": 10},
@@ -143,13 +268,16 @@ ACHIEVEMENT_BADGES = {
     "top_contributor": {"name": "Top Contributor", "icon": "award", "desc": "Reach 500 points", "points": 0},
 }
 
+# Vote-count milestones: {votes_cast: badge_key}
+VOTE_BADGE_THRESHOLDS = {1: "first_vote", 10: "voter_10", 50: "voter_50"}
+
 # Custom tags history per user: {user_id: [tag1, tag2, ...]}
 custom_tags_history = {}
 
 # User favorites: {user_id: [post_id1, post_id2, ...]}
 user_favorites = {}
 
-# User notifications: {user_id: [{id, type, content, source_user, post_id, read, created_at}, ...]}
+# User notifications, newest first, capped at 100 per user: {user_id: deque([{id, type, content, source_user, post_id, read, created_at}, ...])}
 user_notifications = {}
 
 # Private messages: {conversation_id: [{id, sender_id, receiver_id, content, read, created_at}, ...]}
@@ -172,9 +300,37 @@ dream_companies = [
     {"id": "deloitte", "name": "Deloitte", "industry": "Professional Services", "votes": 82, "logo": "D", "description": "Big 4 firm with diverse service offerings", "offer_count": 20, "salary_range": "HK$20,000 - 45,000", "hiring_status": "active", "trending": False},
 ]
 
+# Seed position of each company: companies with equal votes stay in this order, as a stable sort of the seed list
+# would leave them
+_COMPANY_SEED_ORDER = {c["id"]: i for i, c in enumerate(dream_companies)}
+
+
+def _company_rank(company):
+    """Sort key for dream_companies: most votes first, ties in seed order."""
+    return -company["votes"], _COMPANY_SEED_ORDER[company["id"]]
+
+
+# Keep dream_companies ordered by _company_rank; votes only ever grow by one, so a vote just bubbles its company up
+dream_companies = tuple(sorted(dream_companies, key=_company_rank))
+
+# Lookup indices over dream_companies (they share the same dicts; a vote swaps the new row into all of them)
+COMPANIES_BY_ID = {c["id"]: c for c in dream_companies}
+COMPANIES_BY_NAME = {c["name"].lower(): c for c in dream_companies}
+COMPANIES_BY_INDUSTRY = {}
+for _company in dream_companies:
+    _intern_fields(_company)
+    COMPANIES_BY_INDUSTRY.setdefault(_company["industry"].lower(), []).append(_company)
+COMPANIES_BY_INDUSTRY = {industry: tuple(companies) for industry, companies in COMPANIES_BY_INDUSTRY.items()}
+
 # Prohibited words for content moderation
 PROHIBITED_WORDS = ["广告", "微信", "加我", "买卖", "代写", "代考", "赚钱", "兼职刷单", "招代理"]
 
+# Single alternation over all prohibited words, compiled once so moderation is one pass over the text
+_PROHIBITED_RE = re.compile("|".join(re.escape(w) for w in sorted(PROHIBITED_WORDS, key=len, reverse=True)))
+
+# Allowed characters for user-defined post tags: Chinese, English letters, digits (matched against the whole tag)
+_CUSTOM_TAG_RE = re.compile(r'[a-zA-Z0-9\u4e00-\u9fa5]+')
+
 # ============================================================
 # TAG SYSTEM CATEGORIES
 # ============================================================
@@ -216,1122 +372,240 @@ TAG_CATEGORIES = {
 # CAREER DATA (EXPANDED with new categories)
 # ============================================================
 
-CAREER_DATA = {
-    "finance_business": {
-        "label": "Finance & Business",
-        "icon": "💰",
-        "roles": [
-            {
-                "title": "Investment Banking Analyst",
-                "skills": ["Financial Modeling", "Valuation", "Excel/VBA", "Accounting", "Corporate Finance"],
-                "career_path": ["Analyst (2-3 yrs)", "Associate (3 yrs)", "VP (3-4 yrs)", "Director", "Managing Director"],
-                "avg_salary_hkd": "30,000 - 50,000/month (entry)",
-                "companies": [
-                    {"name": "Goldman Sachs", "url": "https://www.goldmansachs.com/careers/"},
-                    {"name": "J.P. Morgan", "url": "https://careers.jpmorgan.com/"},
-                    {"name": "Morgan Stanley", "url": "https://www.morganstanley.com/careers"},
-                    {"name": "HSBC", "url": "https://www.hsbc.com/careers"},
-                    {"name": "UBS", "url": "https://www.ubs.com/global/en/careers.html"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=investment+banking+analyst",
-                "description": "Assist in M&A deals, IPOs, and capital raising. Requires strong analytical and financial modeling skills."
-            },
-            {
-                "title": "Management Consultant",
-                "skills": ["Problem Solving", "Data Analysis", "Presentation", "Business Strategy", "Communication"],
-                "career_path": ["Analyst (2 yrs)", "Consultant (2 yrs)", "Manager (3 yrs)", "Principal", "Partner"],
-                "avg_salary_hkd": "25,000 - 45,000/month (entry)",
-                "companies": [
-                    {"name": "McKinsey", "url": "https://www.mckinsey.com/careers"},
-                    {"name": "BCG", "url": "https://careers.bcg.com/"},
-                    {"name": "Bain", "url": "https://www.bain.com/careers/"},
-                    {"name": "Deloitte", "url": "https://www2.deloitte.com/cn/en/careers.html"},
-                    {"name": "PwC", "url": "https://www.pwc.com/gx/en/careers.html"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=management+consultant",
-                "description": "Help organizations solve complex business problems and improve performance."
-            },
-            {
-                "title": "Accountant / Auditor",
-                "skills": ["HKFRS/IFRS", "Auditing", "Taxation", "Excel", "Analytical Skills"],
-                "career_path": ["Associate (2-3 yrs)", "Senior Associate (2 yrs)", "Manager (3 yrs)", "Senior Manager", "Partner"],
-                "avg_salary_hkd": "18,000 - 28,000/month (entry)",
-                "companies": [
-                    {"name": "Deloitte", "url": "https://www2.deloitte.com/cn/en/careers.html"},
-                    {"name": "PwC", "url": "https://www.pwc.com/gx/en/careers.html"},
-                    {"name": "EY", "url": "https://www.ey.com/en_gl/careers"},
-                    {"name": "KPMG", "url": "https://home.kpmg/xx/en/home/careers.html"},
-                    {"name": "BDO", "url": "https://www.bdo.global/en-gb/careers"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=auditor+accountant",
-                "description": "Prepare and examine financial records, ensure compliance with regulations."
-            },
-            {
-                "title": "Financial Analyst",
-                "skills": ["Financial Analysis", "Data Modeling", "Bloomberg Terminal", "SQL", "Excel"],
-                "career_path": ["Junior Analyst", "Financial Analyst", "Senior Analyst", "Finance Manager", "CFO"],
-                "avg_salary_hkd": "20,000 - 35,000/month (entry)",
-                "companies": [
-                    {"name": "HSBC", "url": "https://www.hsbc.com/careers"},
-                    {"name": "Standard Chartered", "url": "https://www.sc.com/en/careers/"},
-                    {"name": "Bank of China", "url": "https://www.boc.cn/en/aboutboc/ab6/"},
-                    {"name": "Hang Seng Bank", "url": "https://www.hangseng.com/en-hk/careers/"},
-                    {"name": "AIA", "url": "https://www.aia.com/en/careers"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=financial+analyst",
-                "description": "Analyze financial data to guide business decisions and investment strategies."
-            },
-            {
-                "title": "Risk Analyst",
-                "skills": ["Risk Management", "Statistics", "Python/R", "Regulatory Knowledge", "Financial Modeling"],
-                "career_path": ["Analyst", "Senior Analyst", "Risk Manager", "Head of Risk", "CRO"],
-                "avg_salary_hkd": "22,000 - 38,000/month (entry)",
-                "companies": [
-                    {"name": "HKMA", "url": "https://www.hkma.gov.hk/eng/about-the-hkma/career-opportunities/"},
-                    {"name": "SFC", "url": "https://www.sfc.hk/en/Careers"},
-                    {"name": "HSBC", "url": "https://www.hsbc.com/careers"},
-                    {"name": "Standard Chartered", "url": "https://www.sc.com/en/careers/"},
-                    {"name": "Manulife", "url": "https://www.manulife.com/en/careers.html"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=risk+analyst",
-                "description": "Identify and assess risks to help organizations minimize potential losses."
-            }
-        ]
-    },
-    "it_engineering": {
-        "label": "IT / CS-Engineering",
-        "icon": "💻",
-        "roles": [
-            {
-                "title": "Software Engineer",
-                "skills": ["Data Structures & Algorithms", "Python/Java/C++", "System Design", "Git", "APIs"],
-                "career_path": ["Junior Engineer", "Software Engineer", "Senior Engineer", "Staff Engineer", "Principal Engineer"],
-                "avg_salary_hkd": "25,000 - 45,000/month (entry)",
-                "companies": [
-                    {"name": "Google", "url": "https://careers.google.com/"},
-                    {"name": "Meta", "url": "https://www.metacareers.com/"},
-                    {"name": "Amazon", "url": "https://www.amazon.jobs/"},
-                    {"name": "Tencent", "url": "https://careers.tencent.com/"},
-                    {"name": "ByteDance", "url": "https://jobs.bytedance.com/"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=software+engineer",
-                "description": "Design, develop, and maintain software applications and systems."
-            },
-            {
-                "title": "Data Scientist",
-                "skills": ["Python/R", "Machine Learning", "Statistics", "SQL", "Data Visualization"],
-                "career_path": ["Junior Data Scientist", "Data Scientist", "Senior Data Scientist", "Lead DS", "Head of Data"],
-                "avg_salary_hkd": "25,000 - 40,000/month (entry)",
-                "companies": [
-                    {"name": "Alibaba", "url": "https://careers.alibabagroup.com/"},
-                    {"name": "Tencent", "url": "https://careers.tencent.com/"},
-                    {"name": "HSBC", "url": "https://www.hsbc.com/careers"},
-                    {"name": "AXA", "url": "https://www.axa.com/en/careers"},
-                    {"name": "Lalamove", "url": "https://www.lalamove.com/careers"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=data+scientist",
-                "description": "Extract insights from data using statistical methods and machine learning."
-            },
-            {
-                "title": "Cybersecurity Analyst",
-                "skills": ["Network Security", "Penetration Testing", "SIEM", "Risk Assessment", "Incident Response"],
-                "career_path": ["Junior Analyst", "Security Analyst", "Senior Analyst", "Security Architect", "CISO"],
-                "avg_salary_hkd": "22,000 - 38,000/month (entry)",
-                "companies": [
-                    {"name": "CyberPort", "url": "https://www.cyberport.hk/en/careers"},
-                    {"name": "HKMA", "url": "https://www.hkma.gov.hk/eng/about-the-hkma/career-opportunities/"},
-                    {"name": "Deloitte", "url": "https://www2.deloitte.com/cn/en/careers.html"},
-                    {"name": "PwC", "url": "https://www.pwc.com/gx/en/careers.html"},
-                    {"name": "HSBC", "url": "https://www.hsbc.com/careers"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=cybersecurity+analyst",
-                "description": "Protect organizations from cyber threats and ensure data security."
-            },
-            {
-                "title": "Product Manager",
-                "skills": ["User Research", "Agile/Scrum", "Data Analysis", "Wireframing", "Communication"],
-                "career_path": ["APM", "Product Manager", "Senior PM", "Director of Product", "VP of Product"],
-                "avg_salary_hkd": "25,000 - 42,000/month (entry)",
-                "companies": [
-                    {"name": "Google", "url": "https://careers.google.com/"},
-                    {"name": "Meta", "url": "https://www.metacareers.com/"},
-                    {"name": "Shopee", "url": "https://careers.shopee.sg/"},
-                    {"name": "Klook", "url": "https://www.klook.com/careers/"},
-                    {"name": "WeLab", "url": "https://www.welab.co/careers"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=product+manager",
-                "description": "Define product strategy and work with engineering teams to build products users love."
-            },
-            {
-                "title": "DevOps / Cloud Engineer",
-                "skills": ["AWS/Azure/GCP", "Docker/Kubernetes", "CI/CD", "Linux", "Terraform"],
-                "career_path": ["Junior Engineer", "DevOps Engineer", "Senior Engineer", "Lead Engineer", "Head of Infrastructure"],
-                "avg_salary_hkd": "25,000 - 42,000/month (entry)",
-                "companies": [
-                    {"name": "AWS", "url": "https://www.amazon.jobs/en/teams/aws"},
-                    {"name": "Microsoft", "url": "https://careers.microsoft.com/"},
-                    {"name": "Google Cloud", "url": "https://careers.google.com/"},
-                    {"name": "Alibaba Cloud", "url": "https://careers.alibabagroup.com/"},
-                    {"name": "HSBC", "url": "https://www.hsbc.com/careers"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=devops+engineer",
-                "description": "Automate and optimize cloud infrastructure and deployment pipelines."
-            }
-        ]
-    },
-    "arts": {
-        "label": "Faculty of Arts",
-        "icon": "🎨",
-        "roles": [
-            {
-                "title": "Marketing Executive",
-                "skills": ["Digital Marketing", "Content Creation", "Social Media", "Analytics", "Copywriting"],
-                "career_path": ["Executive", "Senior Executive", "Marketing Manager", "Head of Marketing", "CMO"],
-                "avg_salary_hkd": "16,000 - 25,000/month (entry)",
-                "companies": [
-                    {"name": "L'Oreal", "url": "https://careers.loreal.com/"},
-                    {"name": "P&G", "url": "https://www.pgcareers.com/"},
-                    {"name": "Ogilvy", "url": "https://www.ogilvy.com/careers"},
-                    {"name": "Leo Burnett", "url": "https://www.leoburnett.com/careers"},
-                    {"name": "SCMP", "url": "https://www.scmp.com/career"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=marketing+executive",
-                "description": "Plan and execute marketing campaigns to promote products and services."
-            },
-            {
-                "title": "Journalist / Editor",
-                "skills": ["Writing", "Research", "Interviewing", "Content Management", "Media Law"],
-                "career_path": ["Junior Reporter", "Reporter", "Senior Reporter", "Editor", "Chief Editor"],
-                "avg_salary_hkd": "15,000 - 22,000/month (entry)",
-                "companies": [
-                    {"name": "SCMP", "url": "https://www.scmp.com/career"},
-                    {"name": "RTHK", "url": "https://www.rthk.hk/about/career"},
-                    {"name": "Bloomberg", "url": "https://careers.bloomberg.com/"},
-                    {"name": "Reuters", "url": "https://www.thomsonreuters.com/en/careers.html"},
-                    {"name": "TVB", "url": "https://corporate.tvb.com/careers"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=journalist+editor",
-                "description": "Research, write, and edit news stories and articles for media outlets."
-            },
-            {
-                "title": "Public Relations Specialist",
-                "skills": ["Communication", "Media Relations", "Event Planning", "Crisis Management", "Writing"],
-                "career_path": ["PR Assistant", "PR Executive", "PR Manager", "PR Director", "VP Communications"],
-                "avg_salary_hkd": "16,000 - 24,000/month (entry)",
-                "companies": [
-                    {"name": "Edelman", "url": "https://www.edelman.com/careers"},
-                    {"name": "Weber Shandwick", "url": "https://www.webershandwick.com/careers/"},
-                    {"name": "FleishmanHillard", "url": "https://fleishmanhillard.com/careers/"},
-                    {"name": "Burson", "url": "https://www.bursonglobal.com/careers"},
-                    {"name": "MSL", "url": "https://msl.com/careers/"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=public+relations",
-                "description": "Manage public image and communications for organizations."
-            },
-            {
-                "title": "UX/UI Designer",
-                "skills": ["Figma/Sketch", "User Research", "Prototyping", "Visual Design", "Interaction Design"],
-                "career_path": ["Junior Designer", "UX Designer", "Senior Designer", "Lead Designer", "Design Director"],
-                "avg_salary_hkd": "18,000 - 30,000/month (entry)",
-                "companies": [
-                    {"name": "Google", "url": "https://careers.google.com/"},
-                    {"name": "Apple", "url": "https://www.apple.com/careers/"},
-                    {"name": "Klook", "url": "https://www.klook.com/careers/"},
-                    {"name": "HSBC", "url": "https://www.hsbc.com/careers"},
-                    {"name": "Lalamove", "url": "https://www.lalamove.com/careers"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=ux+ui+designer",
-                "description": "Design intuitive and beautiful user interfaces and experiences."
-            },
-            {
-                "title": "Human Resources Specialist",
-                "skills": ["Recruitment", "Employee Relations", "HRIS", "Employment Law", "Communication"],
-                "career_path": ["HR Assistant", "HR Officer", "HR Manager", "HR Director", "CHRO"],
-                "avg_salary_hkd": "16,000 - 24,000/month (entry)",
-                "companies": [
-                    {"name": "Adecco", "url": "https://www.adeccogroup.com/careers/"},
-                    {"name": "Randstad", "url": "https://www.randstad.com/careers/"},
-                    {"name": "Michael Page", "url": "https://www.michaelpage.com/careers"},
-                    {"name": "HSBC", "url": "https://www.hsbc.com/careers"},
-                    {"name": "Cathay Pacific", "url": "https://careers.cathaypacific.com/"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=human+resources",
-                "description": "Manage recruitment, employee relations, and organizational development."
-            }
-        ]
-    },
-    "academic": {
-        "label": "Professors & Academic",
-        "icon": "🎓",
-        "roles": [
-            {
-                "title": "Assistant Professor",
-                "skills": ["Research", "Teaching", "Academic Writing", "Grant Applications", "Mentoring"],
-                "career_path": ["Postdoc", "Assistant Professor", "Associate Professor", "Full Professor", "Chair Professor"],
-                "avg_salary_hkd": "60,000 - 90,000/month",
-                "companies": [
-                    {"name": "HKU", "url": "https://jobs.hku.hk/"},
-                    {"name": "CUHK", "url": "https://www.cuhk.edu.hk/english/career/"},
-                    {"name": "HKUST", "url": "https://career.hkust.edu.hk/"},
-                    {"name": "PolyU", "url": "https://www.polyu.edu.hk/hro/job_opportunities/"},
-                    {"name": "CityU", "url": "https://www.cityu.edu.hk/hro/en/job/"}
-                ],
-                "job_board_url": "https://www.timeshighereducation.com/unijobs/",
-                "description": "Conduct research, teach courses, and supervise graduate students at universities."
-            },
-            {
-                "title": "Research Scientist",
-                "skills": ["Research Methodology", "Data Analysis", "Academic Writing", "Lab Management", "Collaboration"],
-                "career_path": ["Research Assistant", "Postdoc", "Research Scientist", "Senior Scientist", "Principal Investigator"],
-                "avg_salary_hkd": "35,000 - 60,000/month",
-                "companies": [
-                    {"name": "HKUST", "url": "https://career.hkust.edu.hk/"},
-                    {"name": "HKU", "url": "https://jobs.hku.hk/"},
-                    {"name": "HKSTP", "url": "https://www.hkstp.org/careers/"},
-                    {"name": "CityU", "url": "https://www.cityu.edu.hk/hro/en/job/"},
-                    {"name": "Research Institutes", "url": "https://www.ugc.edu.hk/eng/ugc/"}
-                ],
-                "job_board_url": "https://www.nature.com/naturecareers",
-                "description": "Design and conduct research projects to advance scientific knowledge."
-            },
-            {
-                "title": "Postdoctoral Researcher",
-                "skills": ["Independent Research", "Publication", "Grant Writing", "Teaching", "Mentoring"],
-                "career_path": ["PhD", "Postdoc (2-4 yrs)", "Assistant Professor", "Research Scientist"],
-                "avg_salary_hkd": "28,000 - 45,000/month",
-                "companies": [
-                    {"name": "HKU", "url": "https://jobs.hku.hk/"},
-                    {"name": "CUHK", "url": "https://www.cuhk.edu.hk/english/career/"},
-                    {"name": "HKUST", "url": "https://career.hkust.edu.hk/"},
-                    {"name": "CityU", "url": "https://www.cityu.edu.hk/hro/en/job/"},
-                    {"name": "PolyU", "url": "https://www.polyu.edu.hk/hro/job_opportunities/"}
-                ],
-                "job_board_url": "https://academicpositions.com/",
-                "description": "Conduct post-PhD research to build expertise and prepare for faculty positions."
-            },
-            {
-                "title": "Lecturer / Teaching Fellow",
-                "skills": ["Teaching", "Curriculum Design", "Student Assessment", "Communication", "Subject Expertise"],
-                "career_path": ["Tutor", "Teaching Fellow", "Lecturer", "Senior Lecturer", "Principal Lecturer"],
-                "avg_salary_hkd": "35,000 - 55,000/month",
-                "companies": [
-                    {"name": "HKU SPACE", "url": "https://hkuspace.hku.hk/about-us/career"},
-                    {"name": "CUHK", "url": "https://www.cuhk.edu.hk/english/career/"},
-                    {"name": "PolyU", "url": "https://www.polyu.edu.hk/hro/job_opportunities/"},
-                    {"name": "CityU", "url": "https://www.cityu.edu.hk/hro/en/job/"},
-                    {"name": "HKBU", "url": "https://pers.hkbu.edu.hk/job_vacancies/"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=lecturer",
-                "description": "Focus on teaching excellence and course development at universities."
-            }
-        ]
-    },
-    "entrepreneurship": {
-        "label": "Entrepreneurship & Startup",
-        "icon": "🚀",
-        "roles": [
-            {
-                "title": "Startup Founder / Co-founder",
-                "skills": ["Business Planning", "Fundraising", "Product Development", "Leadership", "Sales"],
-                "career_path": ["Employee", "Side Project", "Seed Stage", "Series A", "Scale-up", "Exit/IPO"],
-                "avg_salary_hkd": "Varies (equity-based)",
-                "companies": [
-                    {"name": "Cyberport", "url": "https://www.cyberport.hk/en/incubation"},
-                    {"name": "HKSTP", "url": "https://www.hkstp.org/"},
-                    {"name": "Alibaba Entrepreneurs Fund", "url": "https://www.ent-fund.org/"},
-                    {"name": "Y Combinator", "url": "https://www.ycombinator.com/"},
-                    {"name": "500 Global", "url": "https://500.co/"}
-                ],
-                "job_board_url": "https://www.startbase.hk/jobs",
-                "description": "Build and lead a new venture from idea to market."
-            },
-            {
-                "title": "Startup Team Member",
-                "skills": ["Adaptability", "Full-stack Skills", "Problem Solving", "Communication", "Resilience"],
-                "career_path": ["Early Employee", "Team Lead", "Department Head", "VP", "Co-founder of next venture"],
-                "avg_salary_hkd": "20,000 - 40,000/month + equity",
-                "companies": [
-                    {"name": "Startup Jobs HK", "url": "https://www.startbase.hk/jobs"},
-                    {"name": "AngelList", "url": "https://angel.co/"},
-                    {"name": "Cyberport Startups", "url": "https://www.cyberport.hk/en/incubation"},
-                    {"name": "HKSTP Startups", "url": "https://www.hkstp.org/"},
-                    {"name": "WHub", "url": "https://www.whub.io/jobs"}
-                ],
-                "job_board_url": "https://angel.co/location/hong-kong",
-                "description": "Join an early-stage company and wear multiple hats to build something new."
-            },
-            {
-                "title": "Venture Builder",
-                "skills": ["Business Development", "Market Research", "Financial Modeling", "Networking", "Operations"],
-                "career_path": ["Analyst", "Associate", "Principal", "Partner", "Founder"],
-                "avg_salary_hkd": "30,000 - 60,000/month",
-                "companies": [
-                    {"name": "Brinc", "url": "https://www.brinc.io/careers/"},
-                    {"name": "Zeroth.AI", "url": "https://www.zeroth.ai/"},
-                    {"name": "Betatron", "url": "https://www.betatron.co/"},
-                    {"name": "Nest.vc", "url": "https://nest.vc/"},
-                    {"name": "Mind Fund", "url": "https://mindfund.hk/"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=venture+builder",
-                "description": "Help create and launch new startups within an accelerator or studio."
-            }
-        ]
-    },
-    "freelance": {
-        "label": "Freelance & Independent",
-        "icon": "🎯",
-        "roles": [
-            {
-                "title": "Freelance Developer",
-                "skills": ["Web Development", "Mobile Development", "Client Management", "Project Management", "Marketing"],
-                "career_path": ["Part-time gigs", "Freelance", "Agency", "Consultancy", "Tech Founder"],
-                "avg_salary_hkd": "$300-800/hour",
-                "companies": [
-                    {"name": "Upwork", "url": "https://www.upwork.com/"},
-                    {"name": "Toptal", "url": "https://www.toptal.com/"},
-                    {"name": "Fiverr", "url": "https://www.fiverr.com/"},
-                    {"name": "Freelancer", "url": "https://www.freelancer.com/"},
-                    {"name": "99designs", "url": "https://99designs.hk/"}
-                ],
-                "job_board_url": "https://www.upwork.com/freelance-jobs/web-development/",
-                "description": "Provide software development services as an independent contractor."
-            },
-            {
-                "title": "Freelance Designer",
-                "skills": ["Graphic Design", "UI/UX", "Brand Identity", "Portfolio Building", "Client Relations"],
-                "career_path": ["Part-time", "Freelance", "Studio", "Agency Founder", "Creative Director"],
-                "avg_salary_hkd": "$250-600/hour",
-                "companies": [
-                    {"name": "Dribbble", "url": "https://dribbble.com/jobs"},
-                    {"name": "Behance", "url": "https://www.behance.net/joblist"},
-                    {"name": "99designs", "url": "https://99designs.hk/"},
-                    {"name": "Upwork", "url": "https://www.upwork.com/"},
-                    {"name": "Fiverr", "url": "https://www.fiverr.com/"}
-                ],
-                "job_board_url": "https://dribbble.com/jobs",
-                "description": "Offer design services to clients on a project basis."
-            },
-            {
-                "title": "Content Creator / Influencer",
-                "skills": ["Content Strategy", "Video Production", "Social Media", "Personal Branding", "Monetization"],
-                "career_path": ["Hobbyist", "Part-time Creator", "Full-time Creator", "Brand Owner", "Media Company"],
-                "avg_salary_hkd": "Varies widely",
-                "companies": [
-                    {"name": "YouTube", "url": "https://www.youtube.com/creators/"},
-                    {"name": "Instagram", "url": "https://business.instagram.com/"},
-                    {"name": "TikTok", "url": "https://www.tiktok.com/creators/"},
-                    {"name": "Patreon", "url": "https://www.patreon.com/"},
-                    {"name": "Substack", "url": "https://substack.com/"}
-                ],
-                "job_board_url": "https://www.influencer.com/",
-                "description": "Build an audience and create content across digital platforms."
-            },
-            {
-                "title": "Independent Consultant",
-                "skills": ["Domain Expertise", "Client Management", "Business Development", "Presentation", "Problem Solving"],
-                "career_path": ["Industry Expert", "Part-time Consulting", "Full-time Independent", "Boutique Firm"],
-                "avg_salary_hkd": "$500-2000/hour",
-                "companies": [
-                    {"name": "LinkedIn ProFinder", "url": "https://www.linkedin.com/profinder/"},
-                    {"name": "Catalant", "url": "https://gocatalant.com/"},
-                    {"name": "Expert360", "url": "https://expert360.com/"},
-                    {"name": "Upwork", "url": "https://www.upwork.com/"},
-                    {"name": "Clarity.fm", "url": "https://clarity.fm/"}
-                ],
-                "job_board_url": "https://www.linkedin.com/profinder/",
-                "description": "Provide expert advice to organizations on a contract basis."
-            }
-        ]
-    },
-    "government": {
-        "label": "Government & Public Sector",
-        "icon": "🏛️",
-        "roles": [
-            {
-                "title": "Administrative Officer (AO)",
-                "skills": ["Policy Analysis", "Communication", "Leadership", "Critical Thinking", "Public Administration"],
-                "career_path": ["AO (Entry)", "Senior AO", "Principal AO", "Deputy Secretary", "Permanent Secretary"],
-                "avg_salary_hkd": "35,000 - 55,000/month (entry)",
-                "companies": [
-                    {"name": "Civil Service Bureau", "url": "https://www.csb.gov.hk/"},
-                    {"name": "HK Government", "url": "https://www.gov.hk/en/about/job/"},
-                    {"name": "Various Policy Bureaux", "url": "https://www.gov.hk/en/about/govdirectory/"},
-                    {"name": "District Offices", "url": "https://www.had.gov.hk/"},
-                    {"name": "ICAC", "url": "https://www.icac.org.hk/en/careers/"}
-                ],
-                "job_board_url": "https://www.csb.gov.hk/english/recruit/",
-                "description": "Formulate and implement government policies across various bureaux."
-            },
-            {
-                "title": "Executive Officer (EO)",
-                "skills": ["Administration", "Resource Management", "Communication", "Problem Solving", "IT Skills"],
-                "career_path": ["EO II", "EO I", "Senior EO", "Chief EO", "Assistant Director"],
-                "avg_salary_hkd": "28,000 - 40,000/month (entry)",
-                "companies": [
-                    {"name": "Civil Service Bureau", "url": "https://www.csb.gov.hk/"},
-                    {"name": "Immigration Department", "url": "https://www.immd.gov.hk/eng/careers/"},
-                    {"name": "Inland Revenue", "url": "https://www.ird.gov.hk/eng/career/"},
-                    {"name": "Various Departments", "url": "https://www.gov.hk/en/about/job/"},
-                    {"name": "Hospital Authority", "url": "https://www3.ha.org.hk/career/"}
-                ],
-                "job_board_url": "https://www.csb.gov.hk/english/recruit/",
-                "description": "Handle administrative and managerial duties in government departments."
-            },
-            {
-                "title": "Police Inspector",
-                "skills": ["Leadership", "Physical Fitness", "Decision Making", "Communication", "Crisis Management"],
-                "career_path": ["Inspector", "Senior Inspector", "Chief Inspector", "Superintendent", "Commissioner"],
-                "avg_salary_hkd": "42,000 - 55,000/month (entry)",
-                "companies": [
-                    {"name": "Hong Kong Police Force", "url": "https://www.police.gov.hk/ppp_en/15_recruit/"},
-                    {"name": "HKPF", "url": "https://www.police.gov.hk/"},
-                    {"name": "Disciplined Services", "url": "https://www.csb.gov.hk/english/recruit/"},
-                    {"name": "Security Bureau", "url": "https://www.sb.gov.hk/"},
-                    {"name": "Immigration", "url": "https://www.immd.gov.hk/eng/careers/"}
-                ],
-                "job_board_url": "https://www.police.gov.hk/ppp_en/15_recruit/",
-                "description": "Maintain law and order and ensure public safety in Hong Kong."
-            },
-            {
-                "title": "Government Teacher",
-                "skills": ["Teaching", "Curriculum Development", "Classroom Management", "Communication", "Subject Expertise"],
-                "career_path": ["CM/AM", "GM", "SGM", "Principal GM", "Principal"],
-                "avg_salary_hkd": "32,000 - 45,000/month (entry)",
-                "companies": [
-                    {"name": "Education Bureau", "url": "https://www.edb.gov.hk/en/teacher/"},
-                    {"name": "Government Schools", "url": "https://www.edb.gov.hk/"},
-                    {"name": "DSS Schools", "url": "https://www.edb.gov.hk/en/edu-system/primary-secondary/applicable-to-primary-secondary/direct-subsidy-scheme/"},
-                    {"name": "Aided Schools", "url": "https://www.edb.gov.hk/"},
-                    {"name": "International Schools", "url": "https://www.edb.gov.hk/"}
-                ],
-                "job_board_url": "https://www.edb.gov.hk/en/teacher/",
-                "description": "Educate students in government or aided schools."
-            }
-        ]
-    },
-    "college_teacher": {
-        "label": "College Teaching",
-        "icon": "📚",
-        "roles": [
-            {
-                "title": "Community College Instructor",
-                "skills": ["Teaching", "Course Design", "Student Support", "Subject Knowledge", "Assessment"],
-                "career_path": ["Part-time Tutor", "Instructor", "Senior Instructor", "Programme Leader", "Principal"],
-                "avg_salary_hkd": "25,000 - 40,000/month",
-                "companies": [
-                    {"name": "HKU SPACE CC", "url": "https://hkuspace.hku.hk/about-us/career"},
-                    {"name": "CUHK-affiliated colleges", "url": "https://www.cuhk.edu.hk/english/career/"},
-                    {"name": "HKBU-affiliated colleges", "url": "https://pers.hkbu.edu.hk/job_vacancies/"},
-                    {"name": "PolyU HKCC", "url": "https://www.polyu.edu.hk/hro/job_opportunities/"},
-                    {"name": "VTC", "url": "https://www.vtc.edu.hk/html/en/career/"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=community+college+instructor",
-                "description": "Teach associate degree or higher diploma programmes."
-            },
-            {
-                "title": "Language Instructor",
-                "skills": ["Language Proficiency", "Teaching Methodology", "Cultural Knowledge", "Patience", "Communication"],
-                "career_path": ["Part-time Teacher", "Full-time Instructor", "Senior Instructor", "Course Coordinator", "Centre Head"],
-                "avg_salary_hkd": "20,000 - 35,000/month",
-                "companies": [
-                    {"name": "British Council", "url": "https://www.britishcouncil.hk/en/about/careers"},
-                    {"name": "Wall Street English", "url": "https://www.wallstreetenglish.com/careers"},
-                    {"name": "HKU SPACE", "url": "https://hkuspace.hku.hk/about-us/career"},
-                    {"name": "Alliance Française", "url": "https://www.afhongkong.org/en/work-with-us/"},
-                    {"name": "Goethe-Institut", "url": "https://www.goethe.de/ins/cn/en/sta/hon/ueb/kar.html"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=language+instructor",
-                "description": "Teach languages in schools, language centres, or corporate settings."
-            },
-            {
-                "title": "Vocational Trainer",
-                "skills": ["Industry Experience", "Training Design", "Practical Skills", "Assessment", "Mentoring"],
-                "career_path": ["Part-time Trainer", "Trainer", "Senior Trainer", "Programme Manager", "Director"],
-                "avg_salary_hkd": "22,000 - 38,000/month",
-                "companies": [
-                    {"name": "VTC", "url": "https://www.vtc.edu.hk/html/en/career/"},
-                    {"name": "HKPC", "url": "https://www.hkpc.org/en/career"},
-                    {"name": "ERB", "url": "https://www.erb.org/"},
-                    {"name": "Construction Industry Council", "url": "https://www.cic.hk/eng/main/career/"},
-                    {"name": "HKQF", "url": "https://www.hkqf.gov.hk/"}
-                ],
-                "job_board_url": "https://hk.indeed.com/jobs?q=vocational+trainer",
-                "description": "Provide practical training in trades and technical fields."
-            }
-        ]
-    }
-}
+def load_data_file(filename):
+    """Parse a JSON file from the app's data/ directory with the app's JSON provider."""
+    with app.open_resource("data/" + filename) as f:
+        return app.json.loads(f.read())
+
+
+# Category -> {label, icon, roles: [{title, skills, career_path, avg_salary_hkd, companies, job_board_url, description}]}
+CAREER_DATA = load_data_file("career_data.json")
+
+
+def _freeze(obj):
+    """Recursively turn dicts into read-only MappingProxyType views, lists into tuples, and intern strings."""
+    if isinstance(obj, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+
+# Expected shape of CAREER_DATA: {field: type} for each category, role and company entry
+_CATEGORY_SCHEMA = {"label": str, "icon": str, "roles": list}
+_ROLE_SCHEMA = {"title": str, "skills": list, "career_path": list, "avg_salary_hkd": str,
+                "companies": list, "job_board_url": str, "description": str}
+_COMPANY_SCHEMA = {"name": str, "url": str}
+
+
+def _check_fields(entry, schema, where):
+    """Raise ValueError if entry is missing a schema field or holds the wrong type for it."""
+    for field, kind in schema.items():
+        if not isinstance(entry.get(field), kind):
+            raise ValueError(f"career_data.json: {where} needs a {kind.__name__} '{field}'")
+
+
+# Absolute http(s) link: scheme, a host, then anything without whitespace
+_LINK_URL_RE = re.compile(r"https?://[^\s/?#]+\S*")
+
+
+def _validate_career_data(data):
+    """Fail at import if career_data.json drifts from the shape the routes and indices rely on."""
+    titles = set()
+    for cat_key, cat in data.items():
+        _check_fields(cat, _CATEGORY_SCHEMA, cat_key)
+        for role in cat["roles"]:
+            where = f"{cat_key} role {role.get('title')!r}"
+            _check_fields(role, _ROLE_SCHEMA, where)
+            if role["title"] in titles:
+                raise ValueError(f"career_data.json: duplicate role title {role['title']!r}")
+            titles.add(role["title"])
+            if not all(isinstance(skill, str) for skill in role["skills"] + role["career_path"]):
+                raise ValueError(f"career_data.json: {where} skills and career_path must be strings")
+            for company in role["companies"]:
+                _check_fields(company, _COMPANY_SCHEMA, where + " company")
+            for url in [role["job_board_url"]] + [company["url"] for company in role["companies"]]:
+                if not _LINK_URL_RE.fullmatch(url):
+                    raise ValueError(f"career_data.json: {where} has a malformed url {url!r}")
+
+
+_validate_career_data(CAREER_DATA)
+
+# Registry of hiring companies named in CAREER_DATA: {(name, url): read-only entry}; roles listing
+# the same company share one entry instead of each holding its own copy
+CAREER_COMPANIES = {}
+for _cat in CAREER_DATA.values():
+    for _role in _cat["roles"]:
+        _role["companies"] = [CAREER_COMPANIES.setdefault((c["name"], c["url"]), _freeze(c))
+                              for c in _role["companies"]]
+
+# Static reference data: frozen so request handlers can share it without defensive copies
+CAREER_DATA = _freeze(CAREER_DATA)
+
+# Lookup index over CAREER_DATA roles: title -> role (titles are unique across categories)
+ROLE_BY_TITLE = {role["title"]: role for cat in CAREER_DATA.values() for role in cat["roles"]}
+
+# Compact per-role record of the fields derived from each role: title_ci / skills_ci are casefolded once here so
+# case-insensitive matching never re-folds the source strings
+RoleInfo = namedtuple("RoleInfo", "title title_ci skills_ci")
+
+# {title: RoleInfo}
+ROLE_INFO = {title: RoleInfo(title, title.casefold(), tuple(sys.intern(s.casefold()) for s in role["skills"]))
+             for title, role in ROLE_BY_TITLE.items()}
+
+
+# Sorted (casefolded, display) pairs of every role title and skill, for prefix lookups with bisect
+CAREER_TERMS = sorted({(info.title_ci, info.title) for info in ROLE_INFO.values()} |
+                      {pair for info in ROLE_INFO.values()
+                       for pair in zip(info.skills_ci, ROLE_BY_TITLE[info.title]["skills"])})
+_CAREER_TERM_KEYS = [key for key, _ in CAREER_TERMS]
+
+
+def complete_career_term(prefix, limit=8):
+    """Role titles and skills starting with prefix (case-insensitive), in alphabetical order."""
+    prefix = prefix.casefold()
+    start = bisect_left(_CAREER_TERM_KEYS, prefix)
+    matches = []
+    for key, term in CAREER_TERMS[start:start + limit]:
+        if not key.startswith(prefix):
+            break
+        matches.append(term)
+    return matches
 
 # ============================================================
 # ASSESSMENT CONFIGURATION (EXPANDED)
 # ============================================================
 
-ASSESSMENT_WEIGHTS = {
-    "gpa": {"label": "GPA / Grade Points", "weight": 0.15, "max_score": 10},
-    "internships": {"label": "Internships", "weight": 0.15, "max_score": 10},
-    "certifications": {"label": "Certifications", "weight": 0.10, "max_score": 10},
-    "competitions": {"label": "Competitions", "weight": 0.10, "max_score": 10},
-    "projects": {"label": "Projects", "weight": 0.10, "max_score": 10},
-}
+# Scoring config for /api/assess and the self-assessment page, plus per-industry assessment guidelines
+# Frozen like CAREER_DATA, which also interns the guideline and label strings repeated across industries
+_assessment_config = _freeze(load_data_file("assessment.json"))
+ASSESSMENT_WEIGHTS = _assessment_config["assessment_weights"]
+EXPANDED_ASSESSMENT = _assessment_config["expanded_assessment"]
+COMPETITIVENESS_LEVELS = _assessment_config["competitiveness_levels"]
 
-EXPANDED_ASSESSMENT = {
-    "career_cognition": {
-        "label": "Career Cognition",
-        "weight": 0.10,
-        "dimensions": [
-            {"id": "positioning", "label": "Career Positioning", "desc": "How clear is your career goal?"},
-            {"id": "industry", "label": "Industry Understanding", "desc": "How well do you understand your target industry?"},
-            {"id": "path", "label": "Career Development Path", "desc": "Can you articulate your 3-5 year career plan?"}
-        ]
-    },
-    "abilities": {
-        "label": "Ability Assessment",
-        "weight": 0.15,
-        "dimensions": [
-            {"id": "professional", "label": "Professional Skills", "desc": "Technical/domain-specific skills"},
-            {"id": "communication", "label": "Communication", "desc": "Written and verbal communication"},
-            {"id": "learning", "label": "Learning Ability", "desc": "Ability to learn new skills quickly"},
-            {"id": "execution", "label": "Executive Ability", "desc": "Ability to execute and deliver results"},
-            {"id": "stress", "label": "Stress Resistance", "desc": "Ability to work under pressure"}
-        ]
-    },
-    "interests": {
-        "label": "Interests & Preferences",
-        "weight": 0.05,
-        "work_types": ["Analytical", "Creative", "Management", "Technical", "Social/People-oriented"],
-        "industries": ["Finance", "Technology", "Media", "Healthcare", "Education", "Government", "Startups"],
-        "work_patterns": ["9-6 stable", "Flexible hours", "Remote work", "Fast-paced startup", "Corporate environment"]
-    }
-}
+# Scoring records for /api/assess: one AssessmentField per ASSESSMENT_WEIGHTS entry, and the dimension ids of
+# the two 1-5 rated EXPANDED_ASSESSMENT sections
+AssessmentField = namedtuple("AssessmentField", "key label weight max_score")
+ASSESSMENT_FIELDS = tuple(AssessmentField(key, c["label"], c["weight"], c["max_score"]) for key, c in ASSESSMENT_WEIGHTS.items())
+COGNITION_DIMENSION_IDS = tuple(d["id"] for d in EXPANDED_ASSESSMENT["career_cognition"]["dimensions"])
+ABILITY_DIMENSION_IDS = tuple(d["id"] for d in EXPANDED_ASSESSMENT["abilities"]["dimensions"])
 
-COMPETITIVENESS_LEVELS = [
-    {"min": 0, "max": 30, "level": "Needs Improvement", "color": "#ef4444", "advice": "Focus on building foundational skills and gaining initial experience."},
-    {"min": 30, "max": 50, "level": "Developing", "color": "#f97316", "advice": "You're on the right track. Seek more internships and certifications."},
-    {"min": 50, "max": 70, "level": "Competitive", "color": "#eab308", "advice": "Good progress! Aim for leadership roles and high-impact projects."},
-    {"min": 70, "max": 85, "level": "Strong", "color": "#22c55e", "advice": "Excellent profile! Focus on networking and targeting top-tier firms."},
-    {"min": 85, "max": 100, "level": "Outstanding", "color": "#06b6d4", "advice": "Outstanding! You're a top candidate. Aim for the most selective opportunities."},
-]
-
-# Industry-specific subcategories with refined assessment guidelines
-CAREER_SUBCATEGORIES = {
-    "finance_business": {
-        "label": "Finance & Business",
-        "subcategories": {
-            "investment_banking": {
-                "label": "Investment Banking",
-                "guidelines": [
-                    "Financial modeling & valuation proficiency (DCF, LBO, comps)",
-                    "Understanding of M&A processes and capital markets",
-                    "Proficiency in Excel/VBA and PowerPoint for pitch decks",
-                    "Relevant internships at bulge-bracket or boutique banks",
-                    "CFA Level 1 or progress toward CFA is a strong plus"
-                ]
-            },
-            "consulting": {
-                "label": "Management Consulting",
-                "guidelines": [
-                    "Case interview preparation (market sizing, profitability, M&A cases)",
-                    "Strong analytical reasoning and structured problem-solving",
-                    "Excellent presentation and client communication skills",
-                    "Leadership experience in student organizations or projects",
-                    "Knowledge of major industries and business strategy frameworks"
-                ]
-            },
-            "accounting_auditing": {
-                "label": "Accounting / Auditing (AMPB)",
-                "guidelines": [
-                    "Solid understanding of HKFRS/IFRS accounting standards",
-                    "Progress toward HKICPA QP, CPA, or ACCA qualification",
-                    "Attention to detail and analytical thinking for audit work",
-                    "Experience with audit software (e.g., SAP, Oracle, IDEA)",
-                    "Internship at Big 4 or mid-tier accounting firms"
-                ]
-            },
-            "financial_analysis": {
-                "label": "Financial Analysis / Risk",
-                "guidelines": [
-                    "Proficiency in Bloomberg Terminal, FactSet, or Reuters",
-                    "Strong quantitative and statistical analysis skills",
-                    "Knowledge of financial regulations (SFC, HKMA guidelines)",
-                    "Experience with Python/R for data analysis is a plus",
-                    "FRM or CFA progress demonstrates commitment"
-                ]
-            }
-        }
-    },
-    "it_engineering": {
-        "label": "IT / CS-Engineering",
-        "subcategories": {
-            "software_engineering": {
-                "label": "Software Engineering",
-                "guidelines": [
-                    "Data structures & algorithms proficiency (LeetCode 200+ recommended)",
-                    "System design understanding (scalability, databases, APIs)",
-                    "Proficiency in at least 2 programming languages (Python, Java, C++, Go)",
-                    "Open-source contributions or side projects on GitHub",
-                    "Internship experience at tech companies (FAANG-level preferred)"
-                ]
-            },
-            "data_science": {
-                "label": "Data Science / AI",
-                "guidelines": [
-                    "Strong foundation in statistics, probability, and linear algebra",
-                    "Machine learning frameworks (TensorFlow, PyTorch, scikit-learn)",
-                    "SQL proficiency and experience with large datasets",
-                    "Kaggle competition participation or research publications",
-                    "Domain knowledge in a specific industry (finance, healthcare, etc.)"
-                ]
-            },
-            "cybersecurity": {
-                "label": "Cybersecurity",
-                "guidelines": [
-                    "Knowledge of network protocols, firewalls, and encryption",
-                    "Security certifications progress (CompTIA Security+, CEH, CISSP)",
-                    "Hands-on CTF competition experience",
-                    "Understanding of compliance frameworks (ISO 27001, NIST)",
-                    "Penetration testing and vulnerability assessment skills"
-                ]
-            },
-            "product_management": {
-                "label": "Product Management",
-                "guidelines": [
-                    "User research and UX design thinking skills",
-                    "Agile/Scrum methodology experience",
-                    "Data-driven decision making (A/B testing, analytics tools)",
-                    "Technical understanding to communicate with engineering teams",
-                    "APM program applications require strong case study preparation"
-                ]
-            }
-        }
-    },
-    "arts": {
-        "label": "Faculty of Arts",
-        "subcategories": {
-            "marketing": {
-                "label": "Marketing / Digital Marketing",
-                "guidelines": [
-                    "Digital marketing certifications (Google Ads, Meta Blueprint, HubSpot)",
-                    "Content creation portfolio (social media, copywriting, video)",
-                    "Analytics proficiency (Google Analytics, social media insights)",
-                    "Campaign management and A/B testing experience",
-                    "Understanding of SEO/SEM and paid advertising strategies"
-                ]
-            },
-            "media_journalism": {
-                "label": "Media / Journalism",
-                "guidelines": [
-                    "Published writing portfolio (articles, blogs, reports)",
-                    "Multimedia skills (video editing, podcasting, photography)",
-                    "Understanding of media law, ethics, and press freedom",
-                    "Internship at news outlets (SCMP, RTHK, Bloomberg, Reuters)",
-                    "Bilingual proficiency (English/Chinese) is essential in HK"
-                ]
-            },
-            "public_relations": {
-                "label": "Public Relations / Communications",
-                "guidelines": [
-                    "Strong written and verbal communication skills",
-                    "Crisis communication and media relations knowledge",
-                    "Event planning and management experience",
-                    "Portfolio of press releases, media kits, or campaign work",
-                    "Agency internship experience (Ogilvy, Edelman, Weber Shandwick)"
-                ]
-            }
-        }
-    },
-    "academic": {
-        "label": "Academic / Research",
-        "subcategories": {
-            "research": {
-                "label": "Academic Research",
-                "guidelines": [
-                    "Research methodology and academic writing skills",
-                    "Published papers or conference presentations",
-                    "Strong GPA (First Class Honours / 3.7+ for PhD admissions)",
-                    "Research assistant experience under faculty members",
-                    "Grant writing and funding application experience"
-                ]
-            },
-            "teaching": {
-                "label": "Teaching / Education",
-                "guidelines": [
-                    "PGDE or equivalent teaching qualification progress",
-                    "Tutoring or teaching assistant experience",
-                    "Classroom management and curriculum design skills",
-                    "Understanding of education technology and e-learning tools",
-                    "Passion for student development and mentorship"
-                ]
-            }
-        }
-    },
-    "government": {
-        "label": "Government / Public Sector",
-        "subcategories": {
-            "administrative_officer": {
-                "label": "Administrative Officer (AO/EO)",
-                "guidelines": [
-                    "CRE (Common Recruitment Exam) preparation and strong scores",
-                    "JRE (Joint Recruitment Exam) readiness",
-                    "Current affairs knowledge (HK policy, Greater Bay Area, RCEP)",
-                    "Group discussion and panel interview skills",
-                    "Understanding of government structure and policy-making process"
-                ]
-            },
-            "policy_research": {
-                "label": "Policy Research / Think Tank",
-                "guidelines": [
-                    "Policy analysis and research methodology skills",
-                    "Quantitative and qualitative research experience",
-                    "Published policy briefs or research reports",
-                    "Internship at government departments or think tanks",
-                    "Knowledge of HK public policy issues and regional dynamics"
-                ]
-            }
-        }
-    },
-    "entrepreneurship": {
-        "label": "Entrepreneurship",
-        "subcategories": {
-            "startup_founder": {
-                "label": "Startup Founder",
-                "guidelines": [
-                    "Business plan writing and pitch deck preparation",
-                    "Understanding of funding stages (seed, Series A, B, C)",
-                    "MVP development and lean startup methodology",
-                    "Incubator/accelerator program participation (Cyberport, HKSTP)",
-                    "Market validation and customer discovery experience"
-                ]
-            },
-            "venture_capital": {
-                "label": "Venture Capital / Private Equity",
-                "guidelines": [
-                    "Financial modeling and company valuation skills",
-                    "Industry trend analysis and deal sourcing experience",
-                    "Network building in the startup/VC ecosystem",
-                    "Due diligence process understanding",
-                    "Investment thesis development and portfolio management"
-                ]
-            }
-        }
-    }
-}
+# Upper bounds of the (contiguous, ascending) competitiveness bands, for bisect lookups in level_for_score
+_LEVEL_MAXES = tuple(lvl["max"] for lvl in COMPETITIVENESS_LEVELS)
+CAREER_SUBCATEGORIES = _assessment_config["career_subcategories"]
 
 # ============================================================
 # ROUTE TEMPLATES
 # ============================================================
 
-ROUTE_TEMPLATES = {
-    "finance_business": {
-        "year1": {
-            "title": "Freshman Year - Build Foundations",
-            "tasks": [
-                "Maintain GPA above 3.3 (First Class Honours target)",
-                "Join finance/business student societies (e.g., Investment Club)",
-                "Start learning Excel and financial modeling basics",
-                "Attend career talks and networking events",
-                "Read financial news daily (Bloomberg, SCMP Business)",
-                "Begin CFA Level 1 preparation or ACCA fundamentals",
-            ]
-        },
-        "year2": {
-            "title": "Sophomore Year - Gain Experience",
-            "tasks": [
-                "Apply for spring/summer internships at Big 4 or banks",
-                "Take courses in accounting, corporate finance, and statistics",
-                "Participate in case competitions (e.g., HSBC/McKinsey)",
-                "Build financial models and valuation projects",
-                "Network with alumni in target industries",
-                "Obtain Bloomberg Market Concepts certification",
-            ]
-        },
-        "year3": {
-            "title": "Junior Year - Specialize & Lead",
-            "tasks": [
-                "Secure summer internship at target firm (IB, consulting, PE)",
-                "Take advanced electives in your specialization",
-                "Lead a student organization or major project",
-                "Complete CFA Level 1 or equivalent certification",
-                "Build strong relationships with 3-5 industry mentors",
-                "Prepare for full-time recruiting (resume, cover letters, technicals)",
-            ]
-        },
-        "year4": {
-            "title": "Senior Year - Convert & Launch",
-            "tasks": [
-                "Convert internship to full-time offer or apply broadly",
-                "Complete capstone/thesis with industry relevance",
-                "Continue networking and interview preparation",
-                "Attend on-campus recruiting events",
-                "Finalize professional certifications",
-                "Prepare for transition from university to professional life",
-            ]
-        }
-    },
-    "it_engineering": {
-        "year1": {
-            "title": "Freshman Year - Build Foundations",
-            "tasks": [
-                "Master fundamentals: data structures, algorithms, OOP",
-                "Learn Python/Java thoroughly with personal projects",
-                "Set up GitHub and start contributing to open source",
-                "Join coding clubs and attend hackathons",
-                "Complete online courses (CS50, freeCodeCamp)",
-                "Start LeetCode practice (Easy problems)",
-            ]
-        },
-        "year2": {
-            "title": "Sophomore Year - Gain Experience",
-            "tasks": [
-                "Apply for software engineering internships",
-                "Build 2-3 substantial projects for portfolio",
-                "Learn web development (React/Node.js) or mobile dev",
-                "Study system design fundamentals",
-                "Participate in hackathons and coding competitions",
-                "Get cloud certification (AWS/Azure fundamentals)",
-            ]
-        },
-        "year3": {
-            "title": "Junior Year - Specialize & Lead",
-            "tasks": [
-                "Secure internship at top tech company",
-                "Specialize in an area (ML, security, cloud, mobile)",
-                "Lead technical projects or open source contributions",
-                "Practice LeetCode Medium/Hard problems regularly",
-                "Study system design for interviews",
-                "Build industry connections through tech meetups",
-            ]
-        },
-        "year4": {
-            "title": "Senior Year - Convert & Launch",
-            "tasks": [
-                "Convert internship or apply for new grad positions",
-                "Complete FYP with real-world impact",
-                "Prepare for technical interviews intensively",
-                "Contribute to significant open source projects",
-                "Consider graduate school if interested in research",
-                "Network at industry conferences and events",
-            ]
-        }
-    },
-    "arts": {
-        "year1": {
-            "title": "Freshman Year - Build Foundations",
-            "tasks": [
-                "Maintain strong GPA across humanities courses",
-                "Join relevant student media, PR, or creative societies",
-                "Start building a portfolio (writing samples, designs, etc.)",
-                "Learn digital tools (Adobe Suite, Canva, WordPress)",
-                "Attend career exploration workshops",
-                "Start a blog or social media presence in your area",
-            ]
-        },
-        "year2": {
-            "title": "Sophomore Year - Gain Experience",
-            "tasks": [
-                "Apply for internships in media, PR, marketing, or NGOs",
-                "Take cross-disciplinary courses (business, digital media)",
-                "Participate in writing/design/case competitions",
-                "Freelance or volunteer for real-world projects",
-                "Build a professional portfolio website",
-                "Learn basic data analytics and social media marketing",
-            ]
-        },
-        "year3": {
-            "title": "Junior Year - Specialize & Lead",
-            "tasks": [
-                "Secure competitive internship in target industry",
-                "Develop specialization (content, UX, PR, journalism)",
-                "Lead creative projects or student publications",
-                "Build professional network through events and LinkedIn",
-                "Consider certifications (Google Analytics, HubSpot)",
-                "Start informational interviews with industry professionals",
-            ]
-        },
-        "year4": {
-            "title": "Senior Year - Convert & Launch",
-            "tasks": [
-                "Convert internship or apply strategically",
-                "Complete thesis/capstone showcasing expertise",
-                "Finalize and polish professional portfolio",
-                "Leverage alumni network for job opportunities",
-                "Prepare for interviews specific to your industry",
-                "Consider postgraduate study if relevant to career goals",
-            ]
-        }
-    }
+# Year-by-year route plans per faculty: {faculty: {yearN: {title, tasks}}}
+ROUTE_TEMPLATES = dict(_freeze(load_data_file("route_templates.json")))
+
+# Newer categories reuse an existing template family: {category: family}. Aliases share the family's read-only
+# object, so no copy can drift; adding a category is one entry here
+TEMPLATE_FAMILY = {
+    "academic": "arts",
+    "entrepreneurship": "it_engineering",
+    "freelance": "arts",
+    "government": "finance_business",
+    "college_teacher": "arts",
 }
-
-# Copy templates for new categories (simplified)
-ROUTE_TEMPLATES["academic"] = ROUTE_TEMPLATES["arts"]
-ROUTE_TEMPLATES["entrepreneurship"] = ROUTE_TEMPLATES["it_engineering"]
-ROUTE_TEMPLATES["freelance"] = ROUTE_TEMPLATES["arts"]
-ROUTE_TEMPLATES["government"] = ROUTE_TEMPLATES["finance_business"]
-ROUTE_TEMPLATES["college_teacher"] = ROUTE_TEMPLATES["arts"]
+ROUTE_TEMPLATES.update({cat: ROUTE_TEMPLATES[family] for cat, family in TEMPLATE_FAMILY.items()})
+ROUTE_TEMPLATES = MappingProxyType(ROUTE_TEMPLATES)
 
 # ============================================================
 # EXPERIENCE POSTS (with tags support)
 # ============================================================
 
-experience_posts = [
-    {
-        "id": "1",
-        "author": "Anonymous Senior",
-        "author_id": "system",
-        "author_verified": False,
-        "anonymous": True,
-        "university": "HKU",
-        "faculty": "finance_business",
-        "title": "My Journey to Goldman Sachs as a HKU Finance Student",
-        "content": "I started preparing in Year 1 by joining the Investment Society. By Year 2, I had completed the Bloomberg terminal certification and secured a Big 4 internship. Key tips: network early, perfect your technicals, and don't underestimate the importance of soft skills in interviews. The 'Why Hong Kong?' question always comes up - have a genuine answer ready.",
-        "category": "internship",
-        "tags": [{"category": "interview", "subcategory": "skills"}, {"category": "internship", "subcategory": "experience"}],
-        "custom_tags": [],
-        "likes": 42,
-        "liked_by": [],
-        "votes": 0,
-        "voted_by": [],
-        "is_dream_job": False,
-        "created_at": "2025-11-15",
-        "comments": [
-            {"id": "c1", "author": "Anonymous", "author_id": "user1", "author_verified": False, "content": "This is super helpful! Did you do CFA Level 1 before applying?", "created_at": "2025-11-16", "replies": []},
-            {"id": "c2", "author": "Year 2 Student", "author_id": "user2", "author_verified": False, "content": "Thanks for sharing! What case competitions did you join?", "created_at": "2025-11-17", "replies": []},
-            {"id": "c1a", "author": "Finance Junior", "author_id": "user6", "author_verified": False, "content": "Great insights! How important was networking for getting the interview?", "created_at": "2025-11-18", "replies": []},
-            {"id": "c1b", "author": "HKU Year 3", "author_id": "user7", "author_verified": True, "content": "I also got into GS! The technicals were tough but manageable with prep.", "created_at": "2025-11-19", "replies": []},
-            {"id": "c1c", "author": "Aspiring Banker", "author_id": "user8", "author_verified": False, "content": "Did you apply through on-campus recruiting or online?", "created_at": "2025-11-20", "replies": []},
-            {"id": "c1d", "author": "Anonymous", "author_id": "user9", "author_verified": False, "content": "How long was the entire interview process from application to offer?", "created_at": "2025-11-21", "replies": []},
-            {"id": "c1e", "author": "CUHK Finance", "author_id": "user24", "author_verified": False, "content": "What was your GPA when you applied? Does it matter a lot?", "created_at": "2025-11-22", "replies": []},
-            {"id": "c1f", "author": "Banking Hopeful", "author_id": "user25", "author_verified": False, "content": "Did you have any connections or referrals at GS?", "created_at": "2025-11-23", "replies": []},
-            {"id": "c1g", "author": "Year 1 Student", "author_id": "user26", "author_verified": False, "content": "As a freshman, what should I focus on first?", "created_at": "2025-11-24", "replies": []},
-            {"id": "c1h", "author": "Anonymous", "author_id": "user27", "author_verified": False, "content": "How many rounds of interviews did you have?", "created_at": "2025-11-25", "replies": []},
-            {"id": "c1i", "author": "HKU Senior", "author_id": "user28", "author_verified": True, "content": "The soft skills part is so true! They really test your communication.", "created_at": "2025-11-26", "replies": []},
-            {"id": "c1j", "author": "Finance Society", "author_id": "user29", "author_verified": False, "content": "Would love to invite you to share at our next event!", "created_at": "2025-11-27", "replies": []}
-        ]
-    },
-    {
-        "id": "2",
-        "author": "CS Graduate 2025",
-        "author_id": "system",
-        "author_verified": True,
-        "anonymous": False,
-        "university": "CUHK",
-        "faculty": "it_engineering",
-        "title": "How I Landed a Google Offer from CUHK",
-        "content": "Three things that mattered most: 1) Consistent LeetCode practice (I did 300+ problems over 2 years), 2) Real project experience - I contributed to an open source project that became my best talking point, 3) Mock interviews with friends. Start early, the process takes months. Also, don't ignore behavioral questions - Google cares about Googleyness.",
-        "category": "interview",
-        "tags": [{"category": "interview", "subcategory": "skills"}, {"category": "interview", "subcategory": "questions"}],
-        "custom_tags": ["LeetCode"],
-        "likes": 67,
-        "liked_by": [],
-        "votes": 25,
-        "voted_by": [],
-        "is_dream_job": True,
-        "created_at": "2025-10-20",
-        "comments": [
-            {"id": "c3", "author": "Anonymous", "author_id": "user3", "author_verified": False, "content": "Which open source projects do you recommend for beginners?", "created_at": "2025-10-21", "replies": []},
-            {"id": "c3a", "author": "CS Year 2", "author_id": "user10", "author_verified": False, "content": "300+ LeetCode problems is impressive! How did you stay motivated?", "created_at": "2025-10-22", "replies": []},
-            {"id": "c3b", "author": "Tech Enthusiast", "author_id": "user11", "author_verified": True, "content": "What was the hardest part of the Google interview process?", "created_at": "2025-10-23", "replies": []},
-            {"id": "c3c", "author": "CUHK Junior", "author_id": "user12", "author_verified": False, "content": "Did you do any internships before Google?", "created_at": "2025-10-24", "replies": []},
-            {"id": "c3d", "author": "Anonymous", "author_id": "user13", "author_verified": False, "content": "How long did it take from first application to final offer?", "created_at": "2025-10-25", "replies": []},
-            {"id": "c3e", "author": "Coding Newbie", "author_id": "user14", "author_verified": False, "content": "Any tips for someone just starting LeetCode?", "created_at": "2025-10-26", "replies": []},
-            {"id": "c3f", "author": "HKUST CS", "author_id": "user30", "author_verified": False, "content": "Did you use LeetCode Premium? Is it worth it?", "created_at": "2025-10-27", "replies": []},
-            {"id": "c3g", "author": "Software Eng", "author_id": "user31", "author_verified": True, "content": "System design is often overlooked. Good that you mentioned it!", "created_at": "2025-10-28", "replies": []},
-            {"id": "c3h", "author": "Anonymous", "author_id": "user32", "author_verified": False, "content": "What programming languages did they test you on?", "created_at": "2025-10-29", "replies": []},
-            {"id": "c3i", "author": "Year 3 CUHK", "author_id": "user33", "author_verified": False, "content": "How did you balance LeetCode with coursework?", "created_at": "2025-10-30", "replies": []},
-            {"id": "c3j", "author": "Tech Recruiter", "author_id": "user34", "author_verified": True, "content": "Great advice! Behavioral questions are often underestimated.", "created_at": "2025-10-31", "replies": []},
-            {"id": "c3k", "author": "Freshman CS", "author_id": "user35", "author_verified": False, "content": "This is so inspiring! Starting my prep journey now.", "created_at": "2025-11-01", "replies": []},
-            {"id": "c3l", "author": "Anonymous", "author_id": "user36", "author_verified": False, "content": "What was your TC (total compensation)?", "created_at": "2025-11-02", "replies": []}
-        ]
-    },
-    {
-        "id": "3",
-        "author": "Anonymous",
-        "author_id": "system",
-        "author_verified": False,
-        "anonymous": True,
-        "university": "HKUST",
-        "faculty": "arts",
-        "title": "Breaking Into Marketing from an Arts Background",
-        "content": "Don't let anyone tell you arts degrees are useless. I leveraged my writing skills and critical thinking to land a marketing role at L'Oreal. Key: learn digital marketing on the side (Google certifications are free!), build a social media portfolio, and emphasize your unique perspective. Employers value creativity and communication skills highly.",
-        "category": "career_advice",
-        "tags": [{"category": "career_advice", "subcategory": "switching"}],
-        "custom_tags": ["Arts", "Marketing"],
-        "likes": 35,
-        "liked_by": [],
-        "votes": 0,
-        "voted_by": [],
-        "is_dream_job": False,
-        "created_at": "2025-12-01",
-        "comments": [
-            {"id": "c4a", "author": "Arts Student", "author_id": "user15", "author_verified": False, "content": "This gives me so much hope! I was worried my degree wouldn't be practical.", "created_at": "2025-12-02", "replies": []},
-            {"id": "c4b", "author": "Marketing Intern", "author_id": "user16", "author_verified": True, "content": "Can confirm - creativity is highly valued in marketing. Good advice!", "created_at": "2025-12-03", "replies": []},
-            {"id": "c4c", "author": "HKUST Year 2", "author_id": "user17", "author_verified": False, "content": "Which Google certifications did you complete?", "created_at": "2025-12-04", "replies": []},
-            {"id": "c4d", "author": "Anonymous", "author_id": "user18", "author_verified": False, "content": "How did you build your social media portfolio?", "created_at": "2025-12-05", "replies": []},
-            {"id": "c4e", "author": "Creative Writer", "author_id": "user37", "author_verified": False, "content": "Did you do any marketing internships during university?", "created_at": "2025-12-06", "replies": []},
-            {"id": "c4f", "author": "PR Student", "author_id": "user38", "author_verified": False, "content": "How competitive was the L'Oreal application process?", "created_at": "2025-12-07", "replies": []},
-            {"id": "c4g", "author": "Anonymous", "author_id": "user39", "author_verified": False, "content": "What's the salary like for entry-level marketing roles?", "created_at": "2025-12-08", "replies": []},
-            {"id": "c4h", "author": "Digital Marketer", "author_id": "user40", "author_verified": True, "content": "Google Analytics certification is a must-have! Great tip.", "created_at": "2025-12-09", "replies": []},
-            {"id": "c4i", "author": "Arts Year 3", "author_id": "user41", "author_verified": False, "content": "Did you find it hard to compete against business majors?", "created_at": "2025-12-10", "replies": []},
-            {"id": "c4j", "author": "Anonymous", "author_id": "user42", "author_verified": False, "content": "How long did it take to get the job after graduation?", "created_at": "2025-12-11", "replies": []}
-        ]
-    },
-    {
-        "id": "4",
-        "author": "PolyU Alumni",
-        "author_id": "system",
-        "author_verified": True,
-        "anonymous": False,
-        "university": "PolyU",
-        "faculty": "it_engineering",
-        "title": "Resume Tips That Actually Worked For Me",
-        "content": "After getting rejected 20+ times, I revamped my resume with these changes: 1) Quantified every achievement (increased X by Y%), 2) Tailored keywords to each job description, 3) Added a 'Projects' section above 'Education', 4) Got it reviewed by 3 different people. Went from 0 callbacks to 5 interviews in 2 weeks.",
-        "category": "resume",
-        "tags": [{"category": "resume", "subcategory": "writing"}, {"category": "resume", "subcategory": "modification"}],
-        "custom_tags": [],
-        "likes": 89,
-        "liked_by": [],
-        "votes": 0,
-        "voted_by": [],
-        "is_dream_job": False,
-        "created_at": "2025-09-10",
-        "comments": [
-            {"id": "c4", "author": "Anonymous", "author_id": "user4", "author_verified": False, "content": "Could you share a template?", "created_at": "2025-09-11", "replies": []},
-            {"id": "c5", "author": "Year 3 HKUST", "author_id": "user5", "author_verified": True, "content": "Quantifying achievements was a game changer for me too!", "created_at": "2025-09-12", "replies": []},
-            {"id": "c5a", "author": "Job Seeker", "author_id": "user19", "author_verified": False, "content": "20 rejections before success - that's so inspiring! Thanks for sharing.", "created_at": "2025-09-13", "replies": []},
-            {"id": "c5b", "author": "Fresh Grad", "author_id": "user20", "author_verified": False, "content": "Which ATS software do most companies use?", "created_at": "2025-09-14", "replies": []}
-        ]
-    },
-    {
-        "id": "5",
-        "author": "Dream Chaser",
-        "author_id": "system",
-        "author_verified": False,
-        "anonymous": False,
-        "university": "HKU",
-        "faculty": "it_engineering",
-        "title": "My Dream Job: Becoming a Product Manager at a Top Tech Company",
-        "content": "Ever since I used my first smartphone, I knew I wanted to build products that change how people live. My dream is to become a PM at Google or Apple. I'm currently doing APM prep, learning about user research, A/B testing, and product strategy. The path is tough but I believe in starting with clear goals and working backwards.",
-        "category": "dream_job",
-        "tags": [{"category": "dream_job", "subcategory": "goals"}],
-        "custom_tags": ["PM", "Tech"],
-        "likes": 28,
-        "liked_by": [],
-        "votes": 45,
-        "voted_by": [],
-        "is_dream_job": True,
-        "created_at": "2026-01-05",
-        "comments": [
-            {"id": "c6a", "author": "PM Aspirant", "author_id": "user21", "author_verified": False, "content": "Same dream here! What resources are you using for APM prep?", "created_at": "2026-01-06", "replies": []},
-            {"id": "c6b", "author": "Tech PM", "author_id": "user22", "author_verified": True, "content": "Great mindset! Having a clear goal makes all the difference.", "created_at": "2026-01-07", "replies": []},
-            {"id": "c6c", "author": "Anonymous", "author_id": "user23", "author_verified": False, "content": "Are you doing any PM internships this summer?", "created_at": "2026-01-08", "replies": []}
-        ]
-    }
-]
+# Seeded posts: [{id, author, author_id, author_verified, anonymous, university, faculty, title, content, category,
+# tags, custom_tags, likes, liked_by, votes, voted_by, is_dream_job, created_at, comments: [{..., replies}]}]; unlike
+# the reference data these stay mutable, since likes, votes, comments and deletions update them in place
+experience_posts = load_data_file("experience_posts.json")
+
+# Post id -> post, plus the posts filed under each /api/posts filter value: {category: [post]}, {faculty: [post]},
+# {(tag_category, tag_subcategory): [post]}. Lists run newest first like experience_posts; create/delete keep all
+# of them in step through _index_post/_unindex_post, called with _posts_write_lock held together with the
+# experience_posts insert or remove so a concurrent create and delete can't interleave their index updates
+posts_by_id = {}
+posts_by_category = {}
+posts_by_faculty = {}
+posts_by_tag = {}
+_posts_write_lock = threading.Lock()
+
+# Post id -> created_at parsed once to a datetime (None if malformed), for the hottest-posts time windows
+post_created_dt = {}
+
+# Post id -> (lowercased title, lowercased content); posts are never edited, so the search paths lowercase each once
+post_search_text = {}
+
+
+def _parse_post_date(created_at):
+    """Parse a post's "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" created_at; None if it is malformed."""
+    try:
+        if " " in created_at:
+            return datetime.strptime(created_at, "%Y-%m-%d %H:%M")
+        return datetime.strptime(created_at, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return None
+
+
+def _post_index_entries(post):
+    """(index, key) pairs a post is filed under; only string values can match the string query filters."""
+    entries = [(posts_by_category, post["category"]), (posts_by_faculty, post["faculty"])]
+    entries.extend((posts_by_tag, key) for key in dict.fromkeys(
+        (t.get("category"), t.get("subcategory")) for t in post["tags"] if isinstance(t, dict)))
+    return [(index, key) for index, key in entries
+            if all(isinstance(part, str) for part in (key if isinstance(key, tuple) else (key,)))]
+
+
+def walk_comments(post):
+    """Yield every comment and reply of a post, breadth first, without recursion."""
+    pending = deque(post.get("comments", ()))
+    while pending:
+        comment = pending.popleft()
+        yield comment
+        pending.extend(comment.get("replies", ()))
+
+
+def _index_post(post):
+    """File a post (as the newest) in posts_by_id and the filter indices."""
+    posts_by_id[post["id"]] = post
+    post_created_dt[post["id"]] = _parse_post_date(post.get("created_at", ""))
+    post_search_text[post["id"]] = (post["title"].lower(), post["content"].lower())
+    for index, key in _post_index_entries(post):
+        index.setdefault(key, []).insert(0, post)
+
+
+def _unindex_post(post):
+    """Drop a post from posts_by_id and the filter indices."""
+    del posts_by_id[post["id"]]
+    del post_created_dt[post["id"]]
+    del post_search_text[post["id"]]
+    for index, key in _post_index_entries(post):
+        index[key].remove(post)
+        if not index[key]:
+            del index[key]
+
+
+# Author ids, names and taxonomy values repeat across the seeded posts, comments and replies; keep one copy of each
+for _post in experience_posts:
+    for _field in ("author", "author_id", "university", "faculty", "category"):
+        _post[_field] = sys.intern(_post[_field])
+    for _comment in _post["comments"]:
+        for _entry in (_comment, *_comment["replies"]):
+            _entry["author"] = sys.intern(_entry["author"])
+            _entry["author_id"] = sys.intern(_entry["author_id"])
+
+for _post in reversed(experience_posts):
+    _index_post(_post)
 
 # ============================================================
 # JOB RESOURCES (EXPANDED)
 # ============================================================
 
-JOB_RESOURCES = {
+JOB_RESOURCES = _freeze({
     "referrals": [
         {"title": "LinkedIn HK University Alumni Groups", "url": "https://www.linkedin.com/", "desc": "Connect with alumni for referrals"},
         {"title": "HKU Career Services", "url": "https://cedars.hku.hk/careers.html", "desc": "Official HKU career platform with referral programs"},
@@ -1373,9 +647,9 @@ JOB_RESOURCES = {
         {"title": "HK Government Statistics", "url": "https://www.censtatd.gov.hk/", "desc": "Official HK economic and labour statistics"},
         {"title": "Labour Department Reports", "url": "https://www.labour.gov.hk/", "desc": "Employment data and labour market trends"},
     ]
-}
+})
 
-INDUSTRY_REPORTS = {
+INDUSTRY_REPORTS = _freeze({
     "finance": [
         {"title": "HKMA Annual Report", "url": "https://www.hkma.gov.hk/eng/publications-and-research/annual-report/", "desc": "Hong Kong Monetary Authority annual overview", "date": "2025"},
         {"title": "SFC Annual Report", "url": "https://www.sfc.hk/en/Published-resources/Corporate-publications/Annual-reports", "desc": "Securities and Futures Commission report", "date": "2025"},
@@ -1391,35 +665,62 @@ INDUSTRY_REPORTS = {
         {"title": "Quarterly Employment Survey", "url": "https://www.censtatd.gov.hk/", "desc": "Detailed sector employment statistics", "date": "Quarterly"},
         {"title": "Wage and Payroll Statistics", "url": "https://www.censtatd.gov.hk/", "desc": "Salary trends across industries", "date": "Quarterly"},
     ]
-}
+})
 
-GOVERNMENT_POLICIES = [
+GOVERNMENT_POLICIES = _freeze([
     {"title": "Youth Employment and Training Programme", "url": "https://www.yes.labour.gov.hk/", "desc": "Training and job placement for youth aged 15-24", "category": "Youth"},
     {"title": "Continuing Education Fund", "url": "https://www.wfsfaa.gov.hk/cef/", "desc": "Up to HK$25,000 subsidy for approved courses", "category": "Training"},
     {"title": "ERB Courses", "url": "https://www.erb.org/", "desc": "Employees Retraining Board skills upgrading courses", "category": "Training"},
     {"title": "StartmeupHK", "url": "https://www.startmeup.hk/", "desc": "Government support for startups and entrepreneurs", "category": "Entrepreneurship"},
     {"title": "Technology Talent Admission Scheme", "url": "https://www.itc.gov.hk/en/techtas/", "desc": "Fast-track visa for tech talent", "category": "Immigration"},
     {"title": "Graduate Employment Support Scheme", "url": "https://www.labour.gov.hk/", "desc": "Subsidy for employers hiring fresh graduates", "category": "Employment"},
-]
+])
+
+def _validate_resource_links(name, entries):
+    """Fail at import if a resource entry's url is not an absolute http(s) link."""
+    for entry in entries:
+        if not _LINK_URL_RE.fullmatch(entry["url"]):
+            raise ValueError(f"{name}: {entry['title']!r} has a malformed url {entry['url']!r}")
+
+
+for _key, _entries in [*JOB_RESOURCES.items(), *INDUSTRY_REPORTS.items(), ("policies", GOVERNMENT_POLICIES)]:
+    _validate_resource_links(_key, _entries)
+
+# job_search.html embeds all of JOB_RESOURCES as a script literal; it never changes, so it is encoded once, exactly
+# as the template's tojson filter would
+JOB_RESOURCES_JSON = htmlsafe_json_dumps(JOB_RESOURCES, dumps=app.json.dumps, **app.jinja_env.policies["json.dumps_kwargs"])
 
 # ============================================================
 # WEB SCRAPING
 # ============================================================
 
-import requests
-from bs4 import BeautifulSoup
+# requests and bs4 (with urllib3, charset_normalizer, soupsieve and the rest) cost tens of milliseconds to import and
+# are only needed once a live search runs, so they are imported on first use
+
+
+@lru_cache(maxsize=None)
+def scraper_session():
+    """Shared session so repeated searches reuse pooled keep-alive connections instead of a new TLS handshake."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers["User-Agent"] = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                          max_retries=Retry(total=2, read=0, backoff_factor=0.3)))
+    return session
 
 
 def scrape_jobs(query="graduate", location="hong kong"):
     """Scrape job listings. Falls back to curated data if scraping fails."""
     jobs = []
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-    }
 
     try:
+        from bs4 import BeautifulSoup
+
         url = f"https://hk.indeed.com/jobs?q={query}&l={location}"
-        resp = requests.get(url, headers=headers, timeout=8)
+        resp = scraper_session().get(url, timeout=(3, 8))
         if resp.status_code == 200:
             soup = BeautifulSoup(resp.text, "html.parser")
             cards = soup.select(".job_seen_beacon, .jobsearch-ResultsList .result, .tapItem")
@@ -1452,52 +753,151 @@ def scrape_jobs(query="graduate", location="hong kong"):
     return jobs[:12]
 
 
+# Fallback listings for scrape_jobs when the live search returns too few results
+CURATED_JOBS = [
+    {"title": "Graduate Analyst - Investment Banking", "company": "J.P. Morgan", "location": "Central, HK", "link": "https://careers.jpmorgan.com/", "source": "JPMorgan Careers"},
+    {"title": "Management Consulting Analyst", "company": "McKinsey & Company", "location": "Hong Kong", "link": "https://www.mckinsey.com/careers", "source": "McKinsey Careers"},
+    {"title": "Audit Associate - Graduate Programme", "company": "Deloitte", "location": "Hong Kong", "link": "https://www2.deloitte.com/cn/en/careers.html", "source": "Deloitte Careers"},
+    {"title": "Software Engineer - New Graduate", "company": "Google", "location": "Hong Kong", "link": "https://careers.google.com/", "source": "Google Careers"},
+    {"title": "Data Analyst Intern / Graduate", "company": "Tencent", "location": "Hong Kong", "link": "https://careers.tencent.com/", "source": "Tencent Careers"},
+    {"title": "Graduate Software Developer", "company": "HSBC Technology", "location": "Quarry Bay, HK", "link": "https://www.hsbc.com/careers", "source": "HSBC Careers"},
+    {"title": "Marketing Executive - Graduate", "company": "L'Oreal Hong Kong", "location": "Tsim Sha Tsui, HK", "link": "https://careers.loreal.com/", "source": "L'Oreal Careers"},
+    {"title": "PR & Communications Associate", "company": "Edelman", "location": "Central, HK", "link": "https://www.edelman.com/careers", "source": "Edelman Careers"},
+    {"title": "Junior UX Designer", "company": "Klook", "location": "Kwun Tong, HK", "link": "https://www.klook.com/careers/", "source": "Klook Careers"},
+    {"title": "Cybersecurity Analyst - Graduate", "company": "PwC", "location": "Hong Kong", "link": "https://www.pwc.com/gx/en/careers.html", "source": "PwC Careers"},
+    {"title": "Product Manager - Associate", "company": "Shopee", "location": "Hong Kong", "link": "https://careers.shopee.sg/", "source": "Shopee Careers"},
+    {"title": "Financial Risk Analyst - Graduate", "company": "Standard Chartered", "location": "Hong Kong", "link": "https://www.sc.com/en/careers/", "source": "StanChart Careers"},
+    {"title": "Trainee Reporter", "company": "South China Morning Post", "location": "Causeway Bay, HK", "link": "https://www.scmp.com/career", "source": "SCMP Careers"},
+    {"title": "HR Graduate Programme", "company": "Cathay Pacific", "location": "Hong Kong International Airport", "link": "https://careers.cathaypacific.com/", "source": "Cathay Careers"},
+    {"title": "Cloud Engineer - Junior", "company": "Alibaba Cloud", "location": "Hong Kong", "link": "https://careers.alibabagroup.com/", "source": "Alibaba Careers"},
+    {"title": "Administrative Officer (AO)", "company": "HK Government", "location": "Hong Kong", "link": "https://www.csb.gov.hk/english/recruit/", "source": "Civil Service"},
+    {"title": "Executive Officer (EO)", "company": "HK Government", "location": "Hong Kong", "link": "https://www.csb.gov.hk/english/recruit/", "source": "Civil Service"},
+    {"title": "Assistant Professor", "company": "HKU", "location": "Hong Kong", "link": "https://jobs.hku.hk/", "source": "HKU Careers"},
+    {"title": "Research Associate", "company": "HKUST", "location": "Clear Water Bay", "link": "https://career.hkust.edu.hk/", "source": "HKUST Careers"},
+    {"title": "Startup Associate", "company": "Cyberport", "location": "Pok Fu Lam", "link": "https://www.cyberport.hk/en/incubation", "source": "Cyberport"},
+]
+
+# (query keywords, title keywords) per job family, tried in order: the first family with a keyword in the query
+# selects the curated jobs whose title contains one of its title keywords
+_CURATED_JOB_RULES = (
+    (("finance", "banking", "accounting", "business"), ("analyst", "banking", "audit", "financial", "consulting")),
+    (("software", "engineer", "developer", "it", "tech", "data", "cs"),
+     ("software", "data", "cloud", "cyber", "product", "developer", "engineer")),
+    (("marketing", "arts", "media", "writing", "design", "pr"),
+     ("marketing", "pr", "ux", "reporter", "hr", "communications", "designer")),
+    (("government", "civil", "public"), ("officer", "government")),
+    (("professor", "academic", "research", "lecturer"), ("professor", "research", "lecturer")),
+    (("startup", "entrepreneur"), ("startup", "associate")),
+)
+
+# Jobs per family, matched once here: ((query keywords, jobs), ...)
+_CURATED_JOBS_BY_FAMILY = tuple(
+    (query_kws, tuple(j for j in CURATED_JOBS if any(k in j["title"].lower() for k in title_kws)))
+    for query_kws, title_kws in _CURATED_JOB_RULES
+)
+
+
 def get_curated_jobs(query):
     """Return curated job listings based on query keywords."""
     query_lower = query.lower()
-    all_jobs = [
-        {"title": "Graduate Analyst - Investment Banking", "company": "J.P. Morgan", "location": "Central, HK", "link": "https://careers.jpmorgan.com/", "source": "JPMorgan Careers"},
-        {"title": "Management Consulting Analyst", "company": "McKinsey & Company", "location": "Hong Kong", "link": "https://www.mckinsey.com/careers", "source": "McKinsey Careers"},
-        {"title": "Audit Associate - Graduate Programme", "company": "Deloitte", "location": "Hong Kong", "link": "https://www2.deloitte.com/cn/en/careers.html", "source": "Deloitte Careers"},
-        {"title": "Software Engineer - New Graduate", "company": "Google", "location": "Hong Kong", "link": "https://careers.google.com/", "source": "Google Careers"},
-        {"title": "Data Analyst Intern / Graduate", "company": "Tencent", "location": "Hong Kong", "link": "https://careers.tencent.com/", "source": "Tencent Careers"},
-        {"title": "Graduate Software Developer", "company": "HSBC Technology", "location": "Quarry Bay, HK", "link": "https://www.hsbc.com/careers", "source": "HSBC Careers"},
-        {"title": "Marketing Executive - Graduate", "company": "L'Oreal Hong Kong", "location": "Tsim Sha Tsui, HK", "link": "https://careers.loreal.com/", "source": "L'Oreal Careers"},
-        {"title": "PR & Communications Associate", "company": "Edelman", "location": "Central, HK", "link": "https://www.edelman.com/careers", "source": "Edelman Careers"},
-        {"title": "Junior UX Designer", "company": "Klook", "location": "Kwun Tong, HK", "link": "https://www.klook.com/careers/", "source": "Klook Careers"},
-        {"title": "Cybersecurity Analyst - Graduate", "company": "PwC", "location": "Hong Kong", "link": "https://www.pwc.com/gx/en/careers.html", "source": "PwC Careers"},
-        {"title": "Product Manager - Associate", "company": "Shopee", "location": "Hong Kong", "link": "https://careers.shopee.sg/", "source": "Shopee Careers"},
-        {"title": "Financial Risk Analyst - Graduate", "company": "Standard Chartered", "location": "Hong Kong", "link": "https://www.sc.com/en/careers/", "source": "StanChart Careers"},
-        {"title": "Trainee Reporter", "company": "South China Morning Post", "location": "Causeway Bay, HK", "link": "https://www.scmp.com/career", "source": "SCMP Careers"},
-        {"title": "HR Graduate Programme", "company": "Cathay Pacific", "location": "Hong Kong International Airport", "link": "https://careers.cathaypacific.com/", "source": "Cathay Careers"},
-        {"title": "Cloud Engineer - Junior", "company": "Alibaba Cloud", "location": "Hong Kong", "link": "https://careers.alibabagroup.com/", "source": "Alibaba Careers"},
-        {"title": "Administrative Officer (AO)", "company": "HK Government", "location": "Hong Kong", "link": "https://www.csb.gov.hk/english/recruit/", "source": "Civil Service"},
-        {"title": "Executive Officer (EO)", "company": "HK Government", "location": "Hong Kong", "link": "https://www.csb.gov.hk/english/recruit/", "source": "Civil Service"},
-        {"title": "Assistant Professor", "company": "HKU", "location": "Hong Kong", "link": "https://jobs.hku.hk/", "source": "HKU Careers"},
-        {"title": "Research Associate", "company": "HKUST", "location": "Clear Water Bay", "link": "https://career.hkust.edu.hk/", "source": "HKUST Careers"},
-        {"title": "Startup Associate", "company": "Cyberport", "location": "Pok Fu Lam", "link": "https://www.cyberport.hk/en/incubation", "source": "Cyberport"},
-    ]
+    for query_kws, jobs in _CURATED_JOBS_BY_FAMILY:
+        if any(kw in query_lower for kw in query_kws):
+            return list(jobs)
+    return CURATED_JOBS[:10]
 
-    if any(kw in query_lower for kw in ["finance", "banking", "accounting", "business"]):
-        return [j for j in all_jobs if any(k in j["title"].lower() for k in ["analyst", "banking", "audit", "financial", "consulting"])]
-    elif any(kw in query_lower for kw in ["software", "engineer", "developer", "it", "tech", "data", "cs"]):
-        return [j for j in all_jobs if any(k in j["title"].lower() for k in ["software", "data", "cloud", "cyber", "product", "developer", "engineer"])]
-    elif any(kw in query_lower for kw in ["marketing", "arts", "media", "writing", "design", "pr"]):
-        return [j for j in all_jobs if any(k in j["title"].lower() for k in ["marketing", "pr", "ux", "reporter", "hr", "communications", "designer"])]
-    elif any(kw in query_lower for kw in ["government", "civil", "public"]):
-        return [j for j in all_jobs if any(k in j["title"].lower() for k in ["officer", "government"])]
-    elif any(kw in query_lower for kw in ["professor", "academic", "research", "lecturer"]):
-        return [j for j in all_jobs if any(k in j["title"].lower() for k in ["professor", "research", "lecturer"])]
-    elif any(kw in query_lower for kw in ["startup", "entrepreneur"]):
-        return [j for j in all_jobs if any(k in j["title"].lower() for k in ["startup", "associate"])]
-    else:
-        return all_jobs[:10]
+
+# ============================================================
+# JSON RESPONSE CACHE
+# ============================================================
+
+# Encoded bodies of read-mostly JSON endpoints: {cache_key: (version, body_bytes, etag)}
+_json_body_cache = {}
+
+# Client cache lifetime for responses built only from static reference data (CAREER_DATA etc.)
+STATIC_MAX_AGE = 86400
+
+
+def cached_json_response(key, version, build, max_age=None):
+    """Return build() as a JSON response, re-encoding only when version changed since the last call for key.
+
+    GET and HEAD responses carry an ETag of the body, so a matching If-None-Match gets a 304; other methods get
+    neither, since clients and caches don't revalidate them.
+    """
+    cached = _json_body_cache.get(key)
+    if cached is None or cached[0] != version:
+        body = app.json.dumps(build(), separators=(",", ":")).encode()
+        cached = (version, body, hashlib.blake2b(body, digest_size=16).hexdigest())
+        _json_body_cache[key] = cached
+    response = app.response_class(cached[1], mimetype="application/json")
+    if max_age is not None:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    if request.method not in ("GET", "HEAD"):
+        return response
+    response.set_etag(cached[2])
+    return response.make_conditional(request)
+
+
+# ============================================================
+# ACCOUNT PERSISTENCE
+# ============================================================
+
+# Optional SQLite write-through store behind users_db; set CAREERHUB_DB to a file path to enable
+_user_store = None
+_user_store_lock = threading.Lock()
+
+
+def open_user_store(path):
+    """Open the SQLite account store in WAL mode and load its rows into users_db."""
+    global _user_store
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS users (email TEXT PRIMARY KEY, data TEXT NOT NULL)")
+    for email, data in conn.execute("SELECT email, data FROM users"):
+        users_db[email] = app.json.loads(data)
+    _user_store = conn
+
+
+def save_user(user):
+    """Write a users_db entry through to the account store, if one is open."""
+    if _user_store is None:
+        return
+    with _user_store_lock:
+        _user_store.execute("INSERT OR REPLACE INTO users (email, data) VALUES (?, ?)",
+                            (user["email"], app.json.dumps(user)))
+
+
+if os.environ.get("CAREERHUB_DB"):
+    open_user_store(os.environ["CAREERHUB_DB"])
 
 
 # ============================================================
 # AUTHENTICATION HELPERS
 # ============================================================
 
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1) if PasswordHasher else None
+
+
+def hash_password(password):
+    """Hash a password with argon2 when available, otherwise werkzeug PBKDF2."""
+    if _password_hasher:
+        return _password_hasher.hash(password)
+    return generate_password_hash(password, method='pbkdf2:sha256')
+
+
+def verify_password(password_hash, password):
+    """Check a password against an argon2 or werkzeug hash."""
+    if password_hash.startswith("$argon2"):
+        if not _password_hasher:
+            return False
+        try:
+            return _password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password)
+
+
 def login_required(f):
     """Decorator to require login for routes."""
     @wraps(f)
@@ -1511,57 +911,93 @@ def login_required(f):
 
 
 def get_current_user():
-    """Get current logged-in user or None."""
-    if 'user_id' not in session:
-        return None
-    email = session.get('email')
-    return users_db.get(email)
+    """Get current logged-in user or None, looked up once per request (page routes ask again from inject_user)."""
+    if "_current_user" not in g:
+        g._current_user = users_db.get(session.get('email')) if 'user_id' in session else None
+    return g._current_user
 
 
 def check_content_moderation(text):
     """Check if content contains prohibited words."""
-    for word in PROHIBITED_WORDS:
-        if word in text:
-            return False, f"Content contains prohibited word: {word}"
+    match = _PROHIBITED_RE.search(text)
+    if match:
+        return False, f"Content contains prohibited word: {match.group()}"
     return True, ""
 
 
+# (start, end) epoch seconds of the current local day; today_start_ts recomputes them only once the day rolls over
+_today_bounds = (0.0, 0.0)
+
+
+def today_start_ts():
+    """Epoch seconds of local midnight today, for comparing against stored like/vote times."""
+    global _today_bounds
+    now = time.time()
+    if not _today_bounds[0] <= now < _today_bounds[1]:
+        midnight = datetime.fromtimestamp(now).replace(hour=0, minute=0, second=0, microsecond=0)
+        _today_bounds = (midnight.timestamp(), (midnight + timedelta(days=1)).timestamp())
+    return _today_bounds[0]
+
+
 def can_like_post(user_id, post_id):
     """Check if user can like a post (once per day, max 50/day)."""
-    if user_id not in user_likes:
-        user_likes[user_id] = {}
-
-    user_post_likes = user_likes[user_id]
-    now = datetime.now()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    user_post_likes = user_likes.setdefault(user_id, {})
+    today_start = today_start_ts()
+
+    # Both limits only look at today, so drop older likes and keep the map small. Likes are recorded in time order
+    # (an unlike removes the entry), so the stale ones are a prefix: stop at the first like from today
+    while user_post_likes:
+        oldest = next(iter(user_post_likes))
+        if user_post_likes[oldest] >= today_start:
+            break
+        del user_post_likes[oldest]
 
     # Check if already liked this post today
     if post_id in user_post_likes:
-        last_like = datetime.fromisoformat(user_post_likes[post_id])
-        if last_like >= today_start:
-            return False, "Today's like, cannot be repeated"
+        return False, "Today's like, cannot be repeated"
 
     # Check daily limit (50 likes per day)
-    today_likes = sum(1 for ts in user_post_likes.values()
-                      if datetime.fromisoformat(ts) >= today_start)
-    if today_likes >= 50:
+    if len(user_post_likes) >= 50:
         return False, "Daily like limit reached (50/day)"
 
     return True, ""
 
 
-def can_vote_for_company(user_id, company_id):
-    """Check if user can vote for a company (once per day)."""
-    if company_id not in company_votes:
-        company_votes[company_id] = {}
+def login_throttled(remote_addr):
+    """Whether an address has failed LOGIN_MAX_FAILURES logins within the last LOGIN_FAILURE_WINDOW seconds."""
+    failures = login_failures.get(remote_addr)
+    return (failures is not None and len(failures) == LOGIN_MAX_FAILURES
+            and failures[0] >= time.time() - LOGIN_FAILURE_WINDOW)
 
-    now = datetime.now()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-    if user_id in company_votes[company_id]:
-        last_vote = datetime.fromisoformat(company_votes[company_id][user_id])
-        if last_vote >= today_start:
-            return False, "You already voted for this company today"
+def record_login_failure(remote_addr):
+    """Note a failed login; the deque keeps only the newest LOGIN_MAX_FAILURES times, oldest first."""
+    now = time.time()
+    with _login_failures_lock:
+        failures = login_failures.get(remote_addr)
+        if failures is None:
+            failures = login_failures[remote_addr] = deque(maxlen=LOGIN_MAX_FAILURES)
+        else:
+            login_failures.move_to_end(remote_addr)
+        failures.append(now)
+
+        # Stale addresses form a prefix of the map; the one just recorded is last and always fresh
+        while (len(login_failures) > LOGIN_FAILURE_ADDRS
+               or next(iter(login_failures.values()))[-1] < now - LOGIN_FAILURE_WINDOW):
+            login_failures.popitem(last=False)
+
+
+def clear_login_failures(remote_addr):
+    """Forget an address's failed logins after it logs in successfully."""
+    with _login_failures_lock:
+        login_failures.pop(remote_addr, None)
+
+
+def can_vote_for_company(user_id, company_id):
+    """Check if user can vote for a company (once per day)."""
+    last_vote = company_votes.get(company_id, {}).get(user_id)
+    if last_vote is not None and last_vote >= today_start_ts():
+        return False, "You already voted for this company today"
 
     return True, ""
 
@@ -1570,17 +1006,15 @@ def validate_custom_tag(tag):
     """Validate custom tag format: 2-10 chars, Chinese/English/numbers only."""
     if not tag or len(tag) < 2 or len(tag) > 10:
         return False, "Tag must be 2-10 characters"
-    if not re.match(r'^[a-zA-Z0-9\u4e00-\u9fa5]+$', tag):
+    if not _CUSTOM_TAG_RE.fullmatch(tag):
         return False, "Tag can only contain Chinese, English, or numbers"
     return True, ""
 
 
 def add_notification(user_id, notif_type, content, source_user_id, post_id=None):
     """Add a notification for a user."""
-    if user_id not in user_notifications:
-        user_notifications[user_id] = []
     notif = {
-        "id": str(uuid.uuid4())[:8],
+        "id": secrets.token_hex(4),
         "type": notif_type,
         "content": content,
         "source_user": source_user_id,
@@ -1588,9 +1022,11 @@ def add_notification(user_id, notif_type, content, source_user_id, post_id=None)
         "read": False,
         "created_at": datetime.now().isoformat()
     }
-    user_notifications[user_id].insert(0, notif)
-    # Keep only last 100 notifications
-    user_notifications[user_id] = user_notifications[user_id][:100]
+    # A full deque drops its oldest entry, keeping only the last 100 notifications
+    notifications = user_notifications.get(user_id)
+    if notifications is None:
+        notifications = user_notifications[user_id] = deque(maxlen=100)
+    notifications.appendleft(notif)
 
 
 # ============================================================
@@ -1613,13 +1049,21 @@ def api_login():
     if not email or not password:
         return jsonify({"success": False, "message": "Please enter email and password"})
 
+    # Checked before any hash work, so repeated guesses from one address stop costing a password verification
+    if login_throttled(request.remote_addr):
+        return jsonify({"success": False, "message": "Too many failed login attempts. Please wait a minute and try again."})
+
     user = users_db.get(email)
     if not user:
+        record_login_failure(request.remote_addr)
         return jsonify({"success": False, "message": "Account not registered. Please sign up first."})
 
-    if not check_password_hash(user["password_hash"], password):
+    if not verify_password(user["password_hash"], password):
+        record_login_failure(request.remote_addr)
         return jsonify({"success": False, "message": "Incorrect password. Please try again."})
 
+    clear_login_failures(request.remote_addr)
+
     # Set session
     session.permanent = True
     session['user_id'] = user['user_id']
@@ -1662,11 +1106,11 @@ def api_register():
         return jsonify({"success": False, "message": "Email already registered. Please login."})
 
     # Create user
-    user_id = str(uuid.uuid4())[:8]
+    user_id = secrets.token_hex(4)
     users_db[email] = {
         "user_id": user_id,
         "email": email,
-        "password_hash": generate_password_hash(password, method='pbkdf2:sha256'),
+        "password_hash": hash_password(password),
         "profile": {},
         "profile_completed": False,
         "verified": False,
@@ -1678,6 +1122,7 @@ def api_register():
         },
         "created_at": datetime.now().isoformat()
     }
+    save_user(users_db[email])
 
     # Auto login
     session.permanent = True
@@ -1738,6 +1183,9 @@ def api_save_profile():
     }
 
     user["profile_completed"] = bool(user["profile"]["name"])
+    save_user(user)
+    # Leaderboard names fall back to profile names
+    _data_versions["achievements"] += 1
     session['name'] = user["profile"]["name"] or "User"
     session['profile_completed'] = user["profile_completed"]
 
@@ -1774,6 +1222,7 @@ def api_verification():
         "submitted_at": datetime.now().isoformat(),
         "approved_at": datetime.now().isoformat()
     }
+    save_user(user)
     session['verified'] = True
 
     return jsonify({"success": True, "message": "Verification approved! You now have full access.", "status": "approved"})
@@ -1801,31 +1250,40 @@ def index():
     return render_template("index.html")
 
 
+# Global search shortcuts as (keyword, result) pairs in ranking order, offered when the keyword occurs anywhere in
+# the query; career shortcuts rank above matching posts and page shortcuts below them
+_CAREER_SEARCH_SHORTCUTS = tuple((keyword, _freeze(result)) for keyword, result in [
+    ("finance", {"title": "Finance Careers", "url": "/career-exploration", "icon": "&#x1F4B0;", "type": "Career Path"}),
+    ("tech", {"title": "Technology Careers", "url": "/career-exploration", "icon": "&#x1F4BB;", "type": "Career Path"}),
+    ("software", {"title": "Software Engineering", "url": "/career-exploration", "icon": "&#x1F4BB;", "type": "Career Path"}),
+    ("marketing", {"title": "Marketing Careers", "url": "/career-exploration", "icon": "&#x1F4E3;", "type": "Career Path"}),
+    ("consulting", {"title": "Consulting Careers", "url": "/career-exploration", "icon": "&#x1F4BC;", "type": "Career Path"}),
+])
+
+_PAGE_SEARCH_SHORTCUTS = tuple((keyword, result) for keywords, result in [
+    (("job", "search", "find", "apply"), {"title": "Job Search", "url": "/job-search", "icon": "&#x1F50D;", "type": "Page"}),
+    (("resume", "cv"), {"title": "Resume Tips", "url": "/experience-sharing", "icon": "&#x1F4C4;", "type": "Resource"}),
+    (("interview", "prep"), {"title": "Interview Preparation", "url": "/experience-sharing", "icon": "&#x1F3A4;", "type": "Resource"}),
+    (("intern", "internship"), {"title": "Internship Opportunities", "url": "/job-search", "icon": "&#x1F393;", "type": "Page"}),
+    (("roadmap", "plan", "route"), {"title": "Career Roadmap", "url": "/personalized-route", "icon": "&#x1F5FA;", "type": "Page"}),
+    (("assess", "test", "evaluation"), {"title": "Self-Assessment", "url": "/career-center/assessment", "icon": "&#x1F4CA;", "type": "Page"}),
+] for result in [_freeze(result)] for keyword in keywords)
+
+
 @app.route("/api/global-search", methods=["GET"])
 def api_global_search():
     """Global search across jobs, posts, and resources."""
     query = request.args.get("q", "").lower().strip()
     if not query or len(query) < 2:
         return jsonify({"success": True, "results": []})
-    
-    results = []
-    
+
     # Search in career paths
-    career_keywords = {
-        "finance": {"title": "Finance Careers", "url": "/career-exploration", "icon": "&#x1F4B0;", "type": "Career Path"},
-        "tech": {"title": "Technology Careers", "url": "/career-exploration", "icon": "&#x1F4BB;", "type": "Career Path"},
-        "software": {"title": "Software Engineering", "url": "/career-exploration", "icon": "&#x1F4BB;", "type": "Career Path"},
-        "marketing": {"title": "Marketing Careers", "url": "/career-exploration", "icon": "&#x1F4E3;", "type": "Career Path"},
-        "consulting": {"title": "Consulting Careers", "url": "/career-exploration", "icon": "&#x1F4BC;", "type": "Career Path"},
-    }
-    
-    for keyword, data in career_keywords.items():
-        if keyword in query:
-            results.append(data)
-    
+    results = [result for keyword, result in _CAREER_SEARCH_SHORTCUTS if keyword in query]
+
     # Search in experience posts
     for post in experience_posts[:10]:
-        if query in post["title"].lower() or query in post["content"].lower():
+        title, content = post_search_text[post["id"]]
+        if query in title or query in content:
             results.append({
                 "title": post["title"][:50] + "..." if len(post["title"]) > 50 else post["title"],
                 "url": f"/experience-sharing?post={post['id']}",
@@ -1836,28 +1294,27 @@ def api_global_search():
                 break
     
     # Search in pages
-    pages = [
-        {"keywords": ["job", "search", "find", "apply"], "title": "Job Search", "url": "/job-search", "icon": "&#x1F50D;", "type": "Page"},
-        {"keywords": ["resume", "cv"], "title": "Resume Tips", "url": "/experience-sharing", "icon": "&#x1F4C4;", "type": "Resource"},
-        {"keywords": ["interview", "prep"], "title": "Interview Preparation", "url": "/experience-sharing", "icon": "&#x1F3A4;", "type": "Resource"},
-        {"keywords": ["intern", "internship"], "title": "Internship Opportunities", "url": "/job-search", "icon": "&#x1F393;", "type": "Page"},
-        {"keywords": ["roadmap", "plan", "route"], "title": "Career Roadmap", "url": "/personalized-route", "icon": "&#x1F5FA;", "type": "Page"},
-        {"keywords": ["assess", "test", "evaluation"], "title": "Self-Assessment", "url": "/career-center/assessment", "icon": "&#x1F4CA;", "type": "Page"},
-    ]
-    
-    for page in pages:
-        if any(kw in query for kw in page["keywords"]):
-            results.append({k: v for k, v in page.items() if k != "keywords"})
-    
-    # Remove duplicates
-    seen = set()
-    unique_results = []
+    results.extend(result for keyword, result in _PAGE_SEARCH_SHORTCUTS if keyword in query)
+
+    # Remove duplicates, keeping the first result for each URL
+    unique_results = {}
     for r in results:
-        if r["url"] not in seen:
-            seen.add(r["url"])
-            unique_results.append(r)
-    
-    return jsonify({"success": True, "results": unique_results[:8]})
+        unique_results.setdefault(r["url"], r)
+
+    return jsonify({"success": True, "results": list(unique_results.values())[:8]})
+
+
+@app.route("/api/career-autocomplete", methods=["GET"])
+def api_career_autocomplete():
+    """Type-ahead suggestions over career role titles and skills."""
+    query = request.args.get("q", "").strip()
+    if not query:
+        return jsonify({"success": True, "suggestions": []})
+    response = jsonify({"success": True, "suggestions": complete_career_term(query)})
+    response.add_etag()
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_MAX_AGE
+    return response.make_conditional(request)
 
 
 @app.route("/career-exploration")
@@ -1871,131 +1328,40 @@ def api_career_match():
     data = request.json
     faculty = data.get("faculty", "")
     if faculty in CAREER_DATA:
-        # Enhance roles with salary progression and traits
-        enhanced_roles = enhance_career_roles(CAREER_DATA[faculty]["roles"], faculty)
-        return jsonify({"success": True, "roles": enhanced_roles, "label": CAREER_DATA[faculty]["label"]})
+        # CAREER_DATA is static, so each faculty's enhanced payload is encoded once and reused
+        return cached_json_response(("career_match", faculty), 0, lambda: {
+            "success": True,
+            # Enhance roles with salary progression and traits
+            "roles": enhance_career_roles(CAREER_DATA[faculty]["roles"], faculty),
+            "label": CAREER_DATA[faculty]["label"]
+        })
     return jsonify({"success": False, "message": "Invalid faculty selected"})
 
 
+# Salary progression and traits shown on the career-match cards: {role title: {salary_progression: [{stage, salary,
+# years}], traits}}, traits per faculty for roles without a profile, and a last-resort traits list; frozen and
+# shared by every response
+_role_profiles_config = _freeze(load_data_file("role_profiles.json"))
+ROLE_PROFILES = _role_profiles_config["role_profiles"]
+FACULTY_TRAITS = _role_profiles_config["faculty_traits"]
+FALLBACK_TRAITS = _role_profiles_config["fallback_traits"]
+
+
 def enhance_career_roles(roles, faculty):
     """Add salary progression and traits data to career roles."""
-    # Salary progression templates by role type
-    salary_data = {
-        "Investment Banking Analyst": {
-            "salary_progression": [
-                {"stage": "Analyst", "salary": "HK$35,000-50,000/mo", "years": "0-3 years"},
-                {"stage": "Associate", "salary": "HK$60,000-85,000/mo", "years": "3-6 years"},
-                {"stage": "VP", "salary": "HK$100,000-150,000/mo", "years": "6-10 years"},
-                {"stage": "Director/MD", "salary": "HK$200,000+/mo", "years": "10+ years"}
-            ],
-            "traits": ["Analytical Mindset", "High Attention to Detail", "Strong Work Ethic", "Resilience Under Pressure", "Team Player"]
-        },
-        "Management Consultant": {
-            "salary_progression": [
-                {"stage": "Analyst/Associate", "salary": "HK$30,000-45,000/mo", "years": "0-2 years"},
-                {"stage": "Consultant", "salary": "HK$50,000-70,000/mo", "years": "2-4 years"},
-                {"stage": "Manager", "salary": "HK$80,000-120,000/mo", "years": "4-7 years"},
-                {"stage": "Partner", "salary": "HK$200,000+/mo", "years": "10+ years"}
-            ],
-            "traits": ["Strategic Thinking", "Client-Facing Skills", "Structured Problem Solver", "Adaptable", "Leadership Potential"]
-        },
-        "Software Engineer": {
-            "salary_progression": [
-                {"stage": "Junior/Entry", "salary": "HK$25,000-35,000/mo", "years": "0-2 years"},
-                {"stage": "Mid-Level", "salary": "HK$40,000-55,000/mo", "years": "2-4 years"},
-                {"stage": "Senior", "salary": "HK$60,000-85,000/mo", "years": "4-7 years"},
-                {"stage": "Staff/Principal", "salary": "HK$100,000+/mo", "years": "7+ years"}
-            ],
-            "traits": ["Logical Thinking", "Continuous Learner", "Problem Solver", "Attention to Detail", "Collaborative"]
-        },
-        "Data Scientist": {
-            "salary_progression": [
-                {"stage": "Junior", "salary": "HK$28,000-38,000/mo", "years": "0-2 years"},
-                {"stage": "Data Scientist", "salary": "HK$45,000-60,000/mo", "years": "2-4 years"},
-                {"stage": "Senior DS", "salary": "HK$70,000-90,000/mo", "years": "4-7 years"},
-                {"stage": "Lead/Head", "salary": "HK$100,000+/mo", "years": "7+ years"}
-            ],
-            "traits": ["Statistical Mindset", "Curious & Inquisitive", "Business Acumen", "Strong Communicator", "Detail-Oriented"]
-        },
-        "Product Manager": {
-            "salary_progression": [
-                {"stage": "APM/Junior", "salary": "HK$28,000-40,000/mo", "years": "0-2 years"},
-                {"stage": "Product Manager", "salary": "HK$45,000-65,000/mo", "years": "2-4 years"},
-                {"stage": "Senior PM", "salary": "HK$70,000-95,000/mo", "years": "4-7 years"},
-                {"stage": "Director/VP", "salary": "HK$120,000+/mo", "years": "7+ years"}
-            ],
-            "traits": ["User Empathy", "Strategic Vision", "Cross-functional Leadership", "Data-Driven", "Excellent Communicator"]
-        },
-        "Marketing Executive": {
-            "salary_progression": [
-                {"stage": "Executive", "salary": "HK$16,000-22,000/mo", "years": "0-2 years"},
-                {"stage": "Senior Executive", "salary": "HK$25,000-35,000/mo", "years": "2-4 years"},
-                {"stage": "Manager", "salary": "HK$40,000-55,000/mo", "years": "4-7 years"},
-                {"stage": "Head/Director", "salary": "HK$70,000+/mo", "years": "7+ years"}
-            ],
-            "traits": ["Creative Thinker", "Trend-Aware", "Strong Writer", "Analytical", "Brand Sensibility"]
-        },
-        "UX/UI Designer": {
-            "salary_progression": [
-                {"stage": "Junior Designer", "salary": "HK$18,000-25,000/mo", "years": "0-2 years"},
-                {"stage": "Designer", "salary": "HK$28,000-40,000/mo", "years": "2-4 years"},
-                {"stage": "Senior Designer", "salary": "HK$45,000-60,000/mo", "years": "4-7 years"},
-                {"stage": "Lead/Director", "salary": "HK$70,000+/mo", "years": "7+ years"}
-            ],
-            "traits": ["Visual Aesthetic", "User-Centric", "Empathetic", "Detail-Oriented", "Collaborative"]
-        },
-        "Accountant / Auditor": {
-            "salary_progression": [
-                {"stage": "Associate", "salary": "HK$18,000-24,000/mo", "years": "0-2 years"},
-                {"stage": "Senior Associate", "salary": "HK$28,000-38,000/mo", "years": "2-4 years"},
-                {"stage": "Manager", "salary": "HK$45,000-60,000/mo", "years": "4-7 years"},
-                {"stage": "Partner", "salary": "HK$150,000+/mo", "years": "12+ years"}
-            ],
-            "traits": ["Meticulous", "Ethical", "Analytical", "Deadline-Driven", "Professional Skepticism"]
-        },
-        "Assistant Professor": {
-            "salary_progression": [
-                {"stage": "Postdoc", "salary": "HK$30,000-40,000/mo", "years": "0-3 years"},
-                {"stage": "Assistant Prof", "salary": "HK$60,000-80,000/mo", "years": "3-6 years"},
-                {"stage": "Associate Prof", "salary": "HK$90,000-120,000/mo", "years": "6-12 years"},
-                {"stage": "Full/Chair Prof", "salary": "HK$150,000+/mo", "years": "12+ years"}
-            ],
-            "traits": ["Research Excellence", "Intellectual Curiosity", "Persistence", "Strong Writer", "Mentoring Ability"]
-        },
-        "Journalist / Editor": {
-            "salary_progression": [
-                {"stage": "Junior Reporter", "salary": "HK$15,000-20,000/mo", "years": "0-2 years"},
-                {"stage": "Reporter", "salary": "HK$22,000-30,000/mo", "years": "2-4 years"},
-                {"stage": "Senior/Editor", "salary": "HK$35,000-50,000/mo", "years": "4-8 years"},
-                {"stage": "Chief Editor", "salary": "HK$60,000+/mo", "years": "8+ years"}
-            ],
-            "traits": ["Curiosity", "Strong Writing", "Deadline-Oriented", "Ethical", "Persistence"]
-        }
-    }
-    
-    # Default traits by faculty
-    default_traits = {
-        "finance_business": ["Analytical", "Detail-Oriented", "Professional", "Resilient", "Team Player"],
-        "it_engineering": ["Logical", "Problem Solver", "Continuous Learner", "Collaborative", "Innovative"],
-        "arts": ["Creative", "Strong Communicator", "Culturally Aware", "Adaptable", "Self-Motivated"],
-        "academic": ["Research-Oriented", "Intellectual Curiosity", "Persistent", "Strong Writer", "Mentor"],
-        "government": ["Public Service Minded", "Ethical", "Structured", "Policy-Aware", "Diplomatic"],
-        "entrepreneurship": ["Risk-Tolerant", "Visionary", "Resilient", "Adaptable", "Resourceful"],
-        "freelance": ["Self-Disciplined", "Client-Focused", "Versatile", "Business-Savvy", "Independent"]
-    }
-    
     enhanced = []
     for role in roles:
         role_copy = dict(role)
-        title = role_copy.get("title", "")
+        title = role_copy["title"]
         
         # Add salary progression if available
-        if title in salary_data:
-            role_copy["salary_progression"] = salary_data[title]["salary_progression"]
-            role_copy["traits"] = salary_data[title]["traits"]
+        profile = ROLE_PROFILES.get(title)
+        if profile is not None:
+            role_copy["salary_progression"] = profile["salary_progression"]
+            role_copy["traits"] = profile["traits"]
         else:
             # Use default traits for faculty
-            role_copy["traits"] = default_traits.get(faculty, ["Professional", "Dedicated", "Team Player"])
+            role_copy["traits"] = FACULTY_TRAITS.get(faculty, FALLBACK_TRAITS)
         
         enhanced.append(role_copy)
     
@@ -2017,6 +1383,14 @@ def self_assessment():
     return render_template("self_assessment.html", dimensions=ASSESSMENT_WEIGHTS, expanded=EXPANDED_ASSESSMENT, subcategories=CAREER_SUBCATEGORIES)
 
 
+def level_for_score(score):
+    """Competitiveness band whose [min, max] range holds score (the lower band on a shared edge); out of range gives the first band."""
+    i = bisect_left(_LEVEL_MAXES, score)
+    if i < len(COMPETITIVENESS_LEVELS) and COMPETITIVENESS_LEVELS[i]["min"] <= score:
+        return COMPETITIVENESS_LEVELS[i]
+    return COMPETITIVENESS_LEVELS[0]
+
+
 @app.route("/api/assess", methods=["POST"])
 def api_assess():
     data = request.json
@@ -2025,34 +1399,30 @@ def api_assess():
     breakdown = {}
 
     # Original dimensions (30%)
-    for key, config in ASSESSMENT_WEIGHTS.items():
-        raw = min(max(int(scores.get(key, 0)), 0), config["max_score"])
-        weighted = (raw / config["max_score"]) * config["weight"] * 100
+    for field in ASSESSMENT_FIELDS:
+        raw = min(max(int(scores.get(field.key, 0)), 0), field.max_score)
+        weighted = (raw / field.max_score) * field.weight * 100
         total += weighted
-        breakdown[key] = {"raw": raw, "weighted": round(weighted, 1), "label": config["label"]}
+        breakdown[field.key] = {"raw": raw, "weighted": round(weighted, 1), "label": field.label}
 
     # Career cognition (10%)
     cognition_scores = scores.get("career_cognition", {})
-    cognition_total = sum(int(cognition_scores.get(d["id"], 3)) for d in EXPANDED_ASSESSMENT["career_cognition"]["dimensions"])
-    cognition_max = len(EXPANDED_ASSESSMENT["career_cognition"]["dimensions"]) * 5
+    cognition_total = sum(int(cognition_scores.get(dim_id, 3)) for dim_id in COGNITION_DIMENSION_IDS)
+    cognition_max = len(COGNITION_DIMENSION_IDS) * 5
     cognition_weighted = (cognition_total / cognition_max) * 0.10 * 100
     total += cognition_weighted
-    breakdown["career_cognition"] = {"raw": round(cognition_total / len(EXPANDED_ASSESSMENT["career_cognition"]["dimensions"]), 1), "weighted": round(cognition_weighted, 1), "label": "Career Cognition"}
+    breakdown["career_cognition"] = {"raw": round(cognition_total / len(COGNITION_DIMENSION_IDS), 1), "weighted": round(cognition_weighted, 1), "label": "Career Cognition"}
 
     # Abilities (15%)
     ability_scores = scores.get("abilities", {})
-    ability_total = sum(int(ability_scores.get(d["id"], 3)) for d in EXPANDED_ASSESSMENT["abilities"]["dimensions"])
-    ability_max = len(EXPANDED_ASSESSMENT["abilities"]["dimensions"]) * 5
+    ability_total = sum(int(ability_scores.get(dim_id, 3)) for dim_id in ABILITY_DIMENSION_IDS)
+    ability_max = len(ABILITY_DIMENSION_IDS) * 5
     ability_weighted = (ability_total / ability_max) * 0.15 * 100
     total += ability_weighted
-    breakdown["abilities"] = {"raw": round(ability_total / len(EXPANDED_ASSESSMENT["abilities"]["dimensions"]), 1), "weighted": round(ability_weighted, 1), "label": "Abilities"}
+    breakdown["abilities"] = {"raw": round(ability_total / len(ABILITY_DIMENSION_IDS), 1), "weighted": round(ability_weighted, 1), "label": "Abilities"}
 
     total = round(total, 1)
-    level_info = COMPETITIVENESS_LEVELS[0]
-    for lvl in COMPETITIVENESS_LEVELS:
-        if lvl["min"] <= total <= lvl["max"]:
-            level_info = lvl
-            break
+    level_info = level_for_score(total)
 
     return jsonify({
         "success": True,
@@ -2102,6 +1472,7 @@ def api_save_career_plan():
         "implementation": data.get("implementation", ""),
         "updated_at": datetime.now().isoformat()
     }
+    save_user(user)
 
     return jsonify({"success": True, "message": "Career plan saved!"})
 
@@ -2427,7 +1798,7 @@ def get_learning_resources(faculty, major, career_goal):
 
 @app.route("/job-search")
 def job_search():
-    return render_template("job_search.html", resources=JOB_RESOURCES)
+    return render_template("job_search.html", resources=JOB_RESOURCES, resources_json=JOB_RESOURCES_JSON)
 
 
 @app.route("/api/search-jobs", methods=["POST"])
@@ -2575,13 +1946,8 @@ def api_get_hottest_posts():
         if post.get("likes", 0) < 20:
             continue
         
-        # Parse created_at date
-        try:
-            if " " in post.get("created_at", ""):
-                post_date = datetime.strptime(post["created_at"], "%Y-%m-%d %H:%M")
-            else:
-                post_date = datetime.strptime(post["created_at"], "%Y-%m-%d")
-        except:
+        post_date = post_created_dt[post["id"]]
+        if post_date is None:
             continue
         
         # Apply time filter
@@ -2635,7 +2001,17 @@ def api_get_posts():
     search = request.args.get("search", "").lower()
     dream_only = request.args.get("dream_only", "false") == "true"
 
-    filtered = experience_posts
+    tag_key = tuple(tag.split(":"))
+
+    # Start from the narrowest prebuilt index, then filter that subset on the remaining fields
+    if len(tag_key) == 2:
+        filtered = list(posts_by_tag.get(tag_key, ()))
+    elif category != "all":
+        filtered = list(posts_by_category.get(category, ()))
+    elif faculty != "all":
+        filtered = list(posts_by_faculty.get(faculty, ()))
+    else:
+        filtered = experience_posts
 
     if dream_only:
         filtered = [p for p in filtered if p.get("is_dream_job")]
@@ -2644,20 +2020,11 @@ def api_get_posts():
         filtered = [p for p in filtered if p["category"] == category]
     if faculty != "all":
         filtered = [p for p in filtered if p["faculty"] == faculty]
-    if tag:
-        parts = tag.split(":")
-        if len(parts) == 2:
-            cat, subcat = parts
-            filtered = [p for p in filtered if any(
-                t.get("category") == cat and t.get("subcategory") == subcat
-                for t in p.get("tags", [])
-            )]
 
     if search:
         filtered = [p for p in filtered if
-                    search in p["title"].lower() or
-                    search in p["content"].lower() or
-                    any(search in c["content"].lower() for c in p.get("comments", []))]
+                    any(search in text for text in post_search_text[p["id"]]) or
+                    any(search in c["content"].lower() for c in walk_comments(p))]
 
     # Add user like and favorite status
     user = get_current_user()
@@ -2720,7 +2087,7 @@ def api_create_post():
         custom_tags_history[uid] = custom_tags_history[uid][:10]  # Keep last 10
 
     post = {
-        "id": str(uuid.uuid4())[:8],
+        "id": secrets.token_hex(4),
         "author": "Anonymous" if data.get("anonymous", True) else data.get("author", "Student"),
         "author_id": user['user_id'] if user else "anonymous",
         "author_verified": user.get('verified', False) if user else False,
@@ -2740,7 +2107,9 @@ def api_create_post():
         "created_at": datetime.now().strftime("%Y-%m-%d"),
         "comments": []
     }
-    experience_posts.insert(0, post)
+    with _posts_write_lock:
+        experience_posts.insert(0, post)
+        _index_post(post)
     return jsonify({"success": True, "post": post})
 
 
@@ -2752,36 +2121,33 @@ def api_like_post(post_id):
 
     user_id = user['user_id']
 
-    for post in experience_posts:
-        if post["id"] == post_id:
-            if "liked_by" not in post:
-                post["liked_by"] = []
+    post = posts_by_id.get(post_id)
+    if post is None:
+        return jsonify({"success": False, "message": "Post not found"})
 
-            # Toggle: if already liked, unlike
-            if user_id in post["liked_by"]:
-                post["liked_by"].remove(user_id)
-                post["likes"] = max(0, post["likes"] - 1)
-                # Remove from tracking
-                if user_id in user_likes and post_id in user_likes[user_id]:
-                    del user_likes[user_id][post_id]
-                return jsonify({"success": True, "likes": post["likes"], "liked": False})
+    if "liked_by" not in post:
+        post["liked_by"] = []
 
-            # Check like limits for new like
-            can_like, msg = can_like_post(user_id, post_id)
-            if not can_like:
-                return jsonify({"success": False, "message": msg, "already_liked": True})
+    # Toggle: if already liked, unlike
+    if user_id in post["liked_by"]:
+        post["liked_by"].remove(user_id)
+        post["likes"] = max(0, post["likes"] - 1)
+        # Remove from tracking
+        user_likes.get(user_id, {}).pop(post_id, None)
+        return jsonify({"success": True, "likes": post["likes"], "liked": False})
 
-            post["likes"] += 1
-            post["liked_by"].append(user_id)
+    # Check like limits for new like
+    can_like, msg = can_like_post(user_id, post_id)
+    if not can_like:
+        return jsonify({"success": False, "message": msg, "already_liked": True})
 
-            # Record like timestamp
-            if user_id not in user_likes:
-                user_likes[user_id] = {}
-            user_likes[user_id][post_id] = datetime.now().isoformat()
+    post["likes"] += 1
+    post["liked_by"].append(user_id)
 
-            return jsonify({"success": True, "likes": post["likes"], "liked": True})
+    # Record like timestamp
+    user_likes.setdefault(user_id, {})[post_id] = time.time()
 
-    return jsonify({"success": False, "message": "Post not found"})
+    return jsonify({"success": True, "likes": post["likes"], "liked": True})
 
 
 @app.route("/api/posts/<post_id>/vote", methods=["POST"])
@@ -2793,22 +2159,33 @@ def api_vote_post(post_id):
 
     user_id = user['user_id']
 
-    for post in experience_posts:
-        if post["id"] == post_id:
-            if not post.get("is_dream_job"):
-                return jsonify({"success": False, "message": "This post is not in Dream Job category"})
+    post = posts_by_id.get(post_id)
+    if post is None:
+        return jsonify({"success": False, "message": "Post not found"})
 
-            if user_id in post.get("voted_by", []):
-                return jsonify({"success": False, "message": "You already voted for this post", "already_voted": True})
+    if not post.get("is_dream_job"):
+        return jsonify({"success": False, "message": "This post is not in Dream Job category"})
 
-            post["votes"] = post.get("votes", 0) + 1
-            if "voted_by" not in post:
-                post["voted_by"] = []
-            post["voted_by"].append(user_id)
+    if user_id in post.get("voted_by", []):
+        return jsonify({"success": False, "message": "You already voted for this post", "already_voted": True})
 
-            return jsonify({"success": True, "votes": post["votes"]})
+    post["votes"] = post.get("votes", 0) + 1
+    if "voted_by" not in post:
+        post["voted_by"] = []
+    post["voted_by"].append(user_id)
 
-    return jsonify({"success": False, "message": "Post not found"})
+    return jsonify({"success": True, "votes": post["votes"]})
+
+
+def comment_author_fields(user, anonymous):
+    """Author fields copied into a comment or reply at write time, so rendering a thread never looks up users."""
+    profile = user.get('profile', {})
+    return {
+        "author": "Anonymous" if anonymous else profile.get('name', 'User'),
+        "author_id": user['user_id'],
+        "author_verified": user.get('verified', False),
+        "author_university": "" if anonymous else profile.get('institution', ''),
+    }
 
 
 @app.route("/api/posts/<post_id>/comment", methods=["POST"])
@@ -2824,25 +2201,24 @@ def api_add_comment(post_id):
     if not ok:
         return jsonify({"success": False, "message": f"Comment rejected: {msg}"})
 
-    for post in experience_posts:
-        if post["id"] == post_id:
-            comment = {
-                "id": str(uuid.uuid4())[:8],
-                "author": user.get('profile', {}).get('name', 'User') if not data.get("anonymous", True) else "Anonymous",
-                "author_id": user['user_id'],
-                "author_verified": user.get('verified', False),
-                "content": content,
-                "replies": [],
-                "created_at": datetime.now().strftime("%Y-%m-%d %H:%M")
-            }
-            post["comments"].append(comment)
-            
-            # Notify post author
-            if post.get("author_id") and post["author_id"] != user['user_id']:
-                add_notification(post["author_id"], "comment", f"New comment on your post: {content[:50]}...", user['user_id'], post_id)
-            
-            return jsonify({"success": True, "comment": comment})
-    return jsonify({"success": False, "message": "Post not found"})
+    post = posts_by_id.get(post_id)
+    if post is None:
+        return jsonify({"success": False, "message": "Post not found"})
+
+    comment = {
+        "id": secrets.token_hex(4),
+        **comment_author_fields(user, data.get("anonymous", True)),
+        "content": content,
+        "replies": [],
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M")
+    }
+    post["comments"].append(comment)
+
+    # Notify post author
+    if post.get("author_id") and post["author_id"] != user['user_id']:
+        add_notification(post["author_id"], "comment", f"New comment on your post: {content[:50]}...", user['user_id'], post_id)
+
+    return jsonify({"success": True, "comment": comment})
 
 
 @app.route("/api/posts/<post_id>/comments/<comment_id>/reply", methods=["POST"])
@@ -2861,29 +2237,54 @@ def api_add_reply(post_id, comment_id):
     if not ok:
         return jsonify({"success": False, "message": f"Reply rejected: {msg}"})
 
-    for post in experience_posts:
-        if post["id"] == post_id:
-            for comment in post.get("comments", []):
-                if comment["id"] == comment_id:
-                    reply = {
-                        "id": str(uuid.uuid4())[:8],
-                        "author": user.get('profile', {}).get('name', 'User') if not data.get("anonymous", True) else "Anonymous",
-                        "author_id": user['user_id'],
-                        "author_verified": user.get('verified', False),
-                        "content": content,
-                        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M")
-                    }
-                    if "replies" not in comment:
-                        comment["replies"] = []
-                    comment["replies"].append(reply)
-                    
-                    # Notify comment author
-                    if comment.get("author_id") and comment["author_id"] != user['user_id']:
-                        add_notification(comment["author_id"], "reply", f"New reply to your comment: {content[:50]}...", user['user_id'], post_id)
-                    
-                    return jsonify({"success": True, "reply": reply})
-            return jsonify({"success": False, "message": "Comment not found"})
-    return jsonify({"success": False, "message": "Post not found"})
+    post = posts_by_id.get(post_id)
+    if post is None:
+        return jsonify({"success": False, "message": "Post not found"})
+
+    for comment in post.get("comments", []):
+        if comment["id"] == comment_id:
+            reply = {
+                "id": secrets.token_hex(4),
+                **comment_author_fields(user, data.get("anonymous", True)),
+                "content": content,
+                "created_at": datetime.now().strftime("%Y-%m-%d %H:%M")
+            }
+            if "replies" not in comment:
+                comment["replies"] = []
+            comment["replies"].append(reply)
+
+            # Notify comment author
+            if comment.get("author_id") and comment["author_id"] != user['user_id']:
+                add_notification(comment["author_id"], "reply", f"New reply to your comment: {content[:50]}...", user['user_id'], post_id)
+
+            return jsonify({"success": True, "reply": reply})
+    return jsonify({"success": False, "message": "Comment not found"})
+
+
+# Largest page /api/posts/<post_id>/comments returns
+COMMENT_PAGE_MAX = 50
+
+
+@app.route("/api/posts/<post_id>/comments", methods=["GET"])
+def api_get_comments(post_id):
+    """Page through a post's comments, oldest first."""
+    post = posts_by_id.get(post_id)
+    if post is None:
+        return jsonify({"success": False, "message": "Post not found"})
+
+    # Comments are only ever appended, so a position is a stable cursor: new comments never shift earlier pages
+    comments = post.get("comments", [])
+    # A malformed or negative cursor is rejected rather than read as 0, which would serve page one again
+    try:
+        start = int(request.args.get("cursor", 0))
+    except ValueError:
+        start = -1
+    if start < 0:
+        return jsonify({"success": False, "message": "Invalid cursor"})
+    limit = min(max(request.args.get("limit", 20, type=int), 1), COMMENT_PAGE_MAX)
+    page = comments[start:start + limit]
+    end = start + len(page)
+    return jsonify({"success": True, "comments": page, "next_cursor": end if end < len(comments) else None})
 
 
 @app.route("/api/custom-tags-history", methods=["GET"])
@@ -2903,9 +2304,9 @@ def api_get_notifications():
     if not user:
         return jsonify({"success": False, "notifications": []})
     uid = user['user_id']
-    notifs = user_notifications.get(uid, [])
+    notifs = user_notifications.get(uid, ())
     unread_count = sum(1 for n in notifs if not n.get("read"))
-    return jsonify({"success": True, "notifications": notifs[:50], "unread_count": unread_count})
+    return jsonify({"success": True, "notifications": list(islice(notifs, 50)), "unread_count": unread_count})
 
 
 @app.route("/api/notifications/read", methods=["POST"])
@@ -2917,7 +2318,7 @@ def api_mark_notifications_read():
         return jsonify({"success": False})
     uid = user['user_id']
     data = request.json
-    notif_ids = data.get("ids", [])
+    notif_ids = set(data.get("ids", []))
     
     if uid in user_notifications:
         for notif in user_notifications[uid]:
@@ -3053,7 +2454,7 @@ def api_send_message(other_user_id):
         private_messages[conv_id] = []
     
     message = {
-        "id": str(uuid.uuid4())[:8],
+        "id": secrets.token_hex(4),
         "sender_id": uid,
         "receiver_id": other_user_id,
         "content": content,
@@ -3158,23 +2559,27 @@ def api_delete_post(post_id):
     uid = user['user_id']
     
     # Find the post
-    for i, post in enumerate(experience_posts):
-        if post["id"] == post_id:
-            # Check ownership
-            if post.get("author_id") != uid:
-                return jsonify({"success": False, "message": "You can only delete your own posts"})
-            
-            # Remove the post
-            experience_posts.pop(i)
-            
-            # Also remove from favorites
-            for u in user_favorites:
-                if post_id in user_favorites[u]:
-                    user_favorites[u].remove(post_id)
-            
-            return jsonify({"success": True, "message": "Post deleted successfully"})
-    
-    return jsonify({"success": False, "message": "Post not found"})
+    post = posts_by_id.get(post_id)
+    if post is None:
+        return jsonify({"success": False, "message": "Post not found"})
+
+    # Check ownership
+    if post.get("author_id") != uid:
+        return jsonify({"success": False, "message": "You can only delete your own posts"})
+
+    # Remove the post; re-checked under the lock so a concurrent delete of the same post removes it only once
+    with _posts_write_lock:
+        if posts_by_id.get(post_id) is not post:
+            return jsonify({"success": False, "message": "Post not found"})
+        experience_posts.remove(post)
+        _unindex_post(post)
+
+    # Also remove from favorites
+    for u in user_favorites:
+        if post_id in user_favorites[u]:
+            user_favorites[u].remove(post_id)
+
+    return jsonify({"success": True, "message": "Post deleted successfully"})
 
 
 @app.route("/my-favorites")
@@ -3213,17 +2618,15 @@ def api_dream_job_posts():
 @app.route("/api/dream-jobs/companies", methods=["GET"])
 def api_dream_companies():
     """Get dream companies sorted by votes."""
-    companies = sorted(dream_companies, key=lambda x: x["votes"], reverse=True)
-
     user = get_current_user()
-    if user:
-        user_id = user['user_id']
-        for company in companies:
-            company['user_voted'] = company["id"] in company_votes and user_id in company_votes[company["id"]]
-    else:
-        for company in companies:
-            company['user_voted'] = False
+    if not user:
+        return cached_json_response("companies", _data_versions["companies"], lambda: {
+            "success": True,
+            "companies": [{**company, "user_voted": False} for company in dream_companies]
+        })
 
+    user_id = user['user_id']
+    companies = [{**company, "user_voted": user_id in company_votes.get(company["id"], ())} for company in dream_companies]
     return jsonify({"success": True, "companies": companies})
 
 
@@ -3236,77 +2639,107 @@ def api_vote_company(company_id):
 
     user_id = user['user_id']
 
-    # Check if can vote
-    can_vote, msg = can_vote_for_company(user_id, company_id)
-    if not can_vote:
-        return jsonify({"success": False, "message": msg, "already_voted": True})
+    if company_id not in COMPANIES_BY_ID:
+        return jsonify({"success": False, "message": "Company not found"})
 
-    for company in dream_companies:
-        if company["id"] == company_id:
-            company["votes"] += 1
+    with _store_write_lock:
+        # Check if can vote
+        can_vote, msg = can_vote_for_company(user_id, company_id)
+        if not can_vote:
+            return jsonify({"success": False, "message": msg, "already_voted": True})
 
-            if company_id not in company_votes:
-                company_votes[company_id] = {}
-            company_votes[company_id][user_id] = datetime.now().isoformat()
+        company = _record_company_vote(COMPANIES_BY_ID[company_id])
+        _data_versions["companies"] += 1
 
-            # Award points and check badges
-            award_user_points(user_id, 5, "vote")
+        company_votes.setdefault(company_id, {})[user_id] = time.time()
 
-            return jsonify({"success": True, "votes": company["votes"]})
+    # Award points and check badges
+    award_user_points(user_id, 5, "vote")
 
-    return jsonify({"success": False, "message": "Company not found"})
+    return jsonify({"success": True, "votes": company["votes"]})
 
 
-def award_user_points(user_id, points, action_type):
-    """Award points to user and check for new badges."""
-    if user_id not in user_achievements:
-        user_achievements[user_id] = {
-            "badges": [],
-            "points": 0,
-            "votes_cast": 0,
-            "offers_shared": 0
-        }
-    
-    user_achievements[user_id]["points"] += points
-    
-    if action_type == "vote":
-        user_achievements[user_id]["votes_cast"] += 1
-        votes = user_achievements[user_id]["votes_cast"]
-        
-        # Check vote badges
-        if votes == 1 and "first_vote" not in user_achievements[user_id]["badges"]:
-            user_achievements[user_id]["badges"].append("first_vote")
-            user_achievements[user_id]["points"] += ACHIEVEMENT_BADGES["first_vote"]["points"]
-        elif votes == 10 and "voter_10" not in user_achievements[user_id]["badges"]:
-            user_achievements[user_id]["badges"].append("voter_10")
-            user_achievements[user_id]["points"] += ACHIEVEMENT_BADGES["voter_10"]["points"]
-        elif votes == 50 and "voter_50" not in user_achievements[user_id]["badges"]:
-            user_achievements[user_id]["badges"].append("voter_50")
-            user_achievements[user_id]["points"] += ACHIEVEMENT_BADGES["voter_50"]["points"]
-    
-    elif action_type == "offer":
-        user_achievements[user_id]["offers_shared"] += 1
-        if "offer_shared" not in user_achievements[user_id]["badges"]:
-            user_achievements[user_id]["badges"].append("offer_shared")
-            user_achievements[user_id]["points"] += ACHIEVEMENT_BADGES["offer_shared"]["points"]
-    
-    # Check top contributor
-    if user_achievements[user_id]["points"] >= 500 and "top_contributor" not in user_achievements[user_id]["badges"]:
-        user_achievements[user_id]["badges"].append("top_contributor")
+def _record_company_vote(company):
+    """Swap in a copy of company with one more vote, bubbled up dream_companies (caller holds _store_write_lock)."""
+    global dream_companies
+    voted = {**company, "votes": company["votes"] + 1}
+    companies = list(dream_companies)
+    i = companies.index(company)
+    companies[i] = voted
+    while i > 0 and _company_rank(companies[i - 1]) > _company_rank(voted):
+        companies[i - 1], companies[i] = companies[i], companies[i - 1]
+        i -= 1
+    dream_companies = tuple(companies)
+
+    COMPANIES_BY_ID[voted["id"]] = voted
+    COMPANIES_BY_NAME[voted["name"].lower()] = voted
+    industry = voted["industry"].lower()
+    COMPANIES_BY_INDUSTRY[industry] = tuple(voted if c is company else c for c in COMPANIES_BY_INDUSTRY[industry])
+    return voted
+
+
+def new_achievement_record():
+    """Empty user_achievements entry for a user who has not earned anything yet."""
+    return {"badges": [], "points": 0, "votes_cast": 0, "offers_shared": 0}
+
+
+def award_user_points(user_id, points, action_type, verified_offer=False):
+    """Award points to user and check for new badges; verified_offer also grants the verified-offer badge."""
+    with _store_write_lock:
+        record = user_achievements.get(user_id) or new_achievement_record()
+        record = {**record, "badges": list(record["badges"])}
+        badges = record["badges"]
+
+        record["points"] += points
+
+        new_badge = None
+        if action_type == "vote":
+            record["votes_cast"] += 1
+            new_badge = VOTE_BADGE_THRESHOLDS.get(record["votes_cast"])
+        elif action_type == "offer":
+            record["offers_shared"] += 1
+            new_badge = "offer_shared"
+
+        if new_badge and new_badge not in badges:
+            badges.append(new_badge)
+            record["points"] += ACHIEVEMENT_BADGES[new_badge]["points"]
+
+        # Check top contributor
+        if record["points"] >= 500 and "top_contributor" not in badges:
+            badges.append("top_contributor")
+
+        if verified_offer and "verified_offer" not in badges:
+            badges.append("verified_offer")
+            record["points"] += ACHIEVEMENT_BADGES["verified_offer"]["points"]
+
+        user_achievements[user_id] = record
+        # Bump only after the record changed, so a leaderboard built in between can't be cached under the new version
+        _data_versions["achievements"] += 1
 
 
 @app.route("/api/dream-jobs/offers", methods=["GET"])
 def api_get_offers():
     """Get offer showcase with optional filters."""
-    industry = request.args.get("industry", "")
+    industry = request.args.get("industry", "").lower()
     sort_by = request.args.get("sort", "recent")  # recent, likes, salary
-    
-    offers = offer_showcase.copy()
-    
+
+    if industry and industry not in COMPANIES_BY_INDUSTRY:
+        return jsonify({"success": True, "offers": []})
+    if sort_by not in ("recent", "likes"):
+        sort_by = ""
+
+    return cached_json_response(("offers", industry, sort_by), _data_versions["offers"],
+                                lambda: {"success": True, "offers": _list_offers(industry, sort_by)})
+
+
+def _list_offers(industry, sort_by):
+    """Filter the offer showcase by (lowercase) industry and sort it."""
     # Filter by industry if specified
     if industry:
-        company_ids = [c["id"] for c in dream_companies if c["industry"].lower() == industry.lower()]
-        offers = [o for o in offers if o.get("company_id") in company_ids]
+        company_ids = {c["id"] for c in COMPANIES_BY_INDUSTRY[industry]}
+        offers = [o for o in offer_showcase if o.get("company_id") in company_ids]
+    else:
+        offers = list(offer_showcase)
     
     # Sort
     if sort_by == "likes":
@@ -3314,13 +2747,14 @@ def api_get_offers():
     elif sort_by == "recent":
         offers.sort(key=lambda x: x.get("created_at", ""), reverse=True)
     
-    return jsonify({"success": True, "offers": offers})
+    return offers
 
 
 @app.route("/api/dream-jobs/offers", methods=["POST"])
 @login_required
 def api_submit_offer():
     """Submit a new offer to the showcase."""
+    global offer_showcase
     user = get_current_user()
     if not user:
         return jsonify({"success": False, "message": "Please login first"})
@@ -3342,13 +2776,10 @@ def api_submit_offer():
         return jsonify({"success": False, "message": msg})
     
     # Find company_id if exists
-    company_id = None
-    for c in dream_companies:
-        if c["name"].lower() == company.lower():
-            company_id = c["id"]
-            break
+    known_company = COMPANIES_BY_NAME.get(company.lower())
+    company_id = known_company["id"] if known_company else None
     
-    offer_id = str(uuid.uuid4())[:8]
+    offer_id = secrets.token_hex(4)
     new_offer = {
         "id": offer_id,
         "user_id": user["user_id"],
@@ -3366,15 +2797,14 @@ def api_submit_offer():
         "created_at": datetime.now().strftime("%Y-%m-%d")
     }
     
-    offer_showcase.insert(0, new_offer)
+    _intern_fields(new_offer)
+    with _store_write_lock:
+        offer_showcase = (new_offer,) + offer_showcase
+        OFFER_BY_ID[offer_id] = new_offer
+        _data_versions["offers"] += 1
     
     # Award points
-    award_user_points(user["user_id"], 50, "offer")
-    if user.get("verified", False) and "verified_offer" not in user_achievements.get(user["user_id"], {}).get("badges", []):
-        if user["user_id"] not in user_achievements:
-            user_achievements[user["user_id"]] = {"badges": [], "points": 0, "votes_cast": 0, "offers_shared": 0}
-        user_achievements[user["user_id"]]["badges"].append("verified_offer")
-        user_achievements[user["user_id"]]["points"] += ACHIEVEMENT_BADGES["verified_offer"]["points"]
+    award_user_points(user["user_id"], 50, "offer", verified_offer=user.get("verified", False))
     
     return jsonify({"success": True, "message": "Offer shared successfully!", "offer": new_offer})
 
@@ -3387,12 +2817,24 @@ def api_like_offer(offer_id):
     if not user:
         return jsonify({"success": False, "message": "Please login first"})
     
-    for offer in offer_showcase:
-        if offer["id"] == offer_id:
-            offer["likes"] = offer.get("likes", 0) + 1
-            return jsonify({"success": True, "likes": offer["likes"]})
-    
-    return jsonify({"success": False, "message": "Offer not found"})
+    offer = OFFER_BY_ID.get(offer_id)
+    if not offer:
+        return jsonify({"success": False, "message": "Offer not found"})
+
+    with _store_write_lock:
+        offer = OFFER_BY_ID[offer_id]
+        offer = _replace_offer(offer, likes=offer.get("likes", 0) + 1)
+        _data_versions["offers"] += 1
+    return jsonify({"success": True, "likes": offer["likes"]})
+
+
+def _replace_offer(offer, **changes):
+    """Swap a changed copy of offer into offer_showcase and OFFER_BY_ID (caller holds _store_write_lock)."""
+    global offer_showcase
+    updated = {**offer, **changes}
+    offer_showcase = tuple(updated if o is offer else o for o in offer_showcase)
+    OFFER_BY_ID[updated["id"]] = updated
+    return updated
 
 
 @app.route("/api/dream-jobs/achievements", methods=["GET"])
@@ -3404,12 +2846,7 @@ def api_get_achievements():
         return jsonify({"success": False})
     
     user_id = user["user_id"]
-    achievements = user_achievements.get(user_id, {
-        "badges": [],
-        "points": 0,
-        "votes_cast": 0,
-        "offers_shared": 0
-    })
+    achievements = user_achievements.get(user_id) or new_achievement_record()
     
     # Add badge details
     badge_details = []
@@ -3431,8 +2868,14 @@ def api_get_achievements():
 @app.route("/api/dream-jobs/leaderboard", methods=["GET"])
 def api_get_leaderboard():
     """Get top contributors leaderboard."""
+    return jsonify({"success": True, "leaderboard": _build_leaderboard(_data_versions["achievements"])})
+
+
+@lru_cache(maxsize=8)
+def _build_leaderboard(version):
+    """Build the top-20 leaderboard; cached per achievements version so reads between writes are free."""
     leaderboard = []
-    for user_id, data in user_achievements.items():
+    for user_id, data in list(user_achievements.items()):
         # Get user name from achievements data first, then users_db
         user_name = data.get("name", "Anonymous")
         if user_name == "Anonymous":
@@ -3451,20 +2894,21 @@ def api_get_leaderboard():
         })
     
     leaderboard.sort(key=lambda x: x["points"], reverse=True)
-    return jsonify({"success": True, "leaderboard": leaderboard[:20]})
+    return leaderboard[:20]
 
 
 @app.route("/api/dream-jobs/stats", methods=["GET"])
 def api_dream_jobs_stats():
     """Get overall dream jobs statistics."""
-    total_votes = sum(c["votes"] for c in dream_companies)
+    companies = dream_companies
+    total_votes = sum(c["votes"] for c in companies)
     total_offers = len(offer_showcase)
-    trending_companies = [c for c in dream_companies if c.get("trending")]
-    active_hiring = len([c for c in dream_companies if c.get("hiring_status") == "active"])
+    trending_companies = [c for c in companies if c.get("trending")]
+    active_hiring = len([c for c in companies if c.get("hiring_status") == "active"])
     
     # Industry breakdown
     industry_stats = {}
-    for company in dream_companies:
+    for company in companies:
         ind = company["industry"]
         if ind not in industry_stats:
             industry_stats[ind] = {"count": 0, "votes": 0}
@@ -3476,7 +2920,7 @@ def api_dream_jobs_stats():
         "stats": {
             "total_votes": total_votes,
             "total_offers": total_offers,
-            "total_companies": len(dream_companies),
+            "total_companies": len(companies),
             "active_hiring": active_hiring,
             "trending_count": len(trending_companies),
             "industry_breakdown": industry_stats
@@ -3504,4 +2948,5 @@ def inject_user():
 # ============================================================
 
 if __name__ == "__main__":
+    load_persistent_secret_key()
     app.run(debug=True, port=5001)
@@ -0,0 +1,27 @@
+"""
+Gunicorn settings for Career Hub: gunicorn app:app
+"""
+
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:5001")
+
+# All stores live in process memory, so extra workers would each see different data;
+# scale with threads unless the stores are moved out of process.
+# The dream-jobs stores (companies, offers, achievements), login_failures and the post
+# indices are written under a lock. user_likes and user_notifications rely on single
+# dict/list/deque operations being atomic, so concurrent requests from the same user can
+# still race on their check-then-update steps, e.g. a like limit overshooting.
+# Set GUNICORN_THREADS=1 if that matters more than throughput.
+workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "16"))
+
+keepalive = 5
+timeout = 30
+
+
+def post_worker_init(worker):
+    # Sessions are signed with the key kept under ~/.careerhub unless CAREERHUB_SECRET is set
+    import app
+    app.load_persistent_secret_key()